@@ -7,8 +7,17 @@ With smart query expansion that expands informal queries to formal job titles
 """
 
 import os
-import json
-from typing import List, Optional
+import asyncio
+import re
+import time
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+import httpx
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -19,6 +28,303 @@ from agents.firecrawl_scraper import FireCrawlJobScraper
 # Load environment variables
 load_dotenv()
 
+# Only the JSearch fields _convert_to_jobs reads: projecting the response keeps
+# payloads (and parse time) small instead of downloading every job attribute
+_JSEARCH_FIELDS = ",".join([
+    "job_title",
+    "employer_name",
+    "job_city",
+    "job_state",
+    "job_country",
+    "job_is_remote",
+    "job_description",
+    "job_apply_link",
+    "job_posted_at_datetime_utc",
+])
+
+# TTL cache of JSearch results keyed on (query, location, num_jobs): job listings are
+# fine to reuse for a few minutes, and every request costs RapidAPI quota. Bounded LRU.
+_JSEARCH_CACHE_TTL = float(os.getenv("JSEARCH_CACHE_TTL", "600"))
+_JSEARCH_CACHE_SIZE = 512
+_jsearch_cache: "OrderedDict[tuple, Tuple[float, List[Job]]]" = OrderedDict()
+# Shared across the API server's request threads, so LRU updates take a lock
+_jsearch_cache_lock = threading.Lock()
+
+# Model used for smart query expansion
+_EXPANSION_MODEL = "gpt-4o-mini"
+
+# Static instructions for query expansion. Kept byte-identical across calls (never
+# interpolated) so OpenAI can reuse the cached prompt prefix; per-query details go in the user message.
+_EXPAND_SYSTEM_PROMPT = """You are a job search expert. Convert the user's job search query into 3-5 formal, professional job titles appropriate for the candidate's experience level.
+
+Return ONLY a JSON array of formal job titles, nothing else.
+
+Example for Junior level:
+User query: "Backend Developer"
+Output: ["Junior Backend Developer", "Backend Developer - Entry Level", "Associate Backend Engineer", "Backend Software Engineer - Junior"]
+
+Example for Mid level:
+User query: "Backend Developer"
+Output: ["Backend Developer", "Backend Software Engineer", "Server-Side Developer", "Backend Engineer"]
+
+Example for Senior level:
+User query: "Backend Developer"
+Output: ["Senior Backend Developer", "Senior Backend Engineer", "Lead Backend Developer", "Principal Backend Engineer"]
+"""
+
+# Prompt guidance per experience level
+_LEVEL_GUIDANCE = {
+    "Junior": "Focus on entry-level positions like: Junior, Associate, Entry Level, Graduate roles",
+    "Mid": "Focus on mid-level positions like: Developer, Engineer, Specialist (no seniority prefix)",
+    "Senior": "Focus on senior positions like: Senior, Lead, Principal, Staff Engineer",
+    "Lead": "Focus on leadership positions like: Lead, Principal, Staff, Engineering Manager"
+}
+
+# Exact-match cache of query expansions, shared by all JobScraper instances
+# (the API server builds a fresh pipeline per request). Bounded LRU.
+_EXPANSION_CACHE_SIZE = 4096
+_expansion_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+# The API server runs each request's pipeline in its own thread, so LRU updates take a lock
+_expansion_cache_lock = threading.Lock()
+
+
+# Common shorthand in informal queries, mapped to a canonical word so that
+# near-duplicates ("python dev", "Python developer", "py developer") share a cache entry
+_QUERY_ALIASES = {
+    "dev": "developer",
+    "devs": "developer",
+    "developers": "developer",
+    "eng": "engineer",
+    "engineers": "engineer",
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "swe": "software engineer",
+    "sre": "site reliability engineer",
+    "ml": "machine learning",
+    "front-end": "frontend",
+    "back-end": "backend",
+    "fullstack": "full stack",
+    "full-stack": "full stack",
+    "sr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+}
+
+_QUERY_TOKEN_RE = re.compile(r"[a-z0-9+#.-]+")
+
+
+def _normalize_query(user_query: str) -> str:
+    """
+    Canonical form of a job query: lowercase tokens with shorthand expanded
+
+    Only trailing "." / "-" are trimmed, so ".NET" keeps its leading dot.
+    """
+    tokens = (token.rstrip(".-").lstrip("-") for token in _QUERY_TOKEN_RE.findall(user_query.lower()))
+    return " ".join(_QUERY_ALIASES.get(token, token) for token in tokens)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client(api_key: str) -> OpenAI:
+    """Shared OpenAI client, so every JobScraper reuses one connection pool"""
+    return OpenAI(api_key=api_key)
+
+
+def _expansion_cache_key(user_query: str, experience_level: str) -> str:
+    """Cache key for a query expansion: model + level + normalized query"""
+    raw = f"{_EXPANSION_MODEL}|{experience_level}|{_normalize_query(user_query)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# Query parameter names that only track the click, not the posting
+_TRACKING_PARAM_RE = re.compile(r"utm_.*|gclid|fbclid|ref", re.IGNORECASE)
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Dedup key for a job URL: drops tracking params (utm_*, gclid, fbclid, ref)
+    and the fragment, strips the path's trailing slash and lowercases the scheme and host,
+    so reposts of the same link match
+
+    Path and query keep their case: ATS job IDs and tokens are often case-sensitive.
+    """
+    parts = urlsplit(url)
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not _TRACKING_PARAM_RE.fullmatch(param.partition("=")[0])
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def _deduplicate_jobs(jobs: List[Job]) -> List[Job]:
+    """
+    Remove duplicate jobs (same title + company, or same normalized URL), keeping the first
+
+    The cheap (title, company) key is checked first so URL normalization
+    only runs for jobs that survive it.
+    """
+    seen_urls = set()
+    seen_jobs = set()
+    unique = []
+
+    for job in jobs:
+        job_id = (job.title.lower(), job.company.lower())
+        if job_id in seen_jobs:
+            continue
+
+        url_key = _normalize_url(job.url) if job.url else None
+        if url_key and url_key in seen_urls:
+            continue
+
+        if url_key:
+            seen_urls.add(url_key)
+        seen_jobs.add(job_id)
+        unique.append(job)
+
+    return unique
+
+
+# Mock data - realistic job postings used by _get_mock_jobs.
+# Built and validated once at import (descriptions pre-stripped); treat as read-only.
+_MOCK_JOB_TEMPLATES = tuple(
+    Job(**{**job_data, "description": job_data["description"].strip()}).model_dump()
+    for job_data in (
+        {
+            "title": "Senior Python Developer",
+            "company": "TechCorp Israel",
+            "location": "Tel Aviv, Israel",
+            "description": """
+            We're looking for a Senior Python Developer to join our backend team.
+
+            Requirements:
+            - 5+ years of Python experience
+            - Strong knowledge of Django/FastAPI
+            - Experience with PostgreSQL, Redis
+            - Docker, Kubernetes experience
+            - AWS/GCP knowledge
+
+            Nice to have:
+            - Microservices architecture
+            - Event-driven systems
+            - LLM integration experience
+            """,
+            "url": "https://example.com/jobs/senior-python-dev-1",
+            "posted_date": "2025-10-18",
+            "source": "linkedin"
+        },
+        {
+            "title": "Python Backend Engineer",
+            "company": "StartupXYZ",
+            "location": "Remote (Israel)",
+            "description": """
+            Join our fast-growing startup as a Backend Engineer!
+
+            Requirements:
+            - 3+ years Python experience
+            - REST API design
+            - SQL databases
+            - Git, CI/CD
+
+            We offer:
+            - Remote work
+            - Equity
+            - Learning budget
+            """,
+            "url": "https://example.com/jobs/python-backend-2",
+            "posted_date": "2025-10-19",
+            "source": "indeed"
+        },
+        {
+            "title": "Full Stack Developer (Python + Vue.js)",
+            "company": "DataScience Ltd",
+            "location": "Herzliya, Israel",
+            "description": """
+            Looking for a Full Stack Developer with Python and Vue.js experience.
+
+            Requirements:
+            - Python (Flask/FastAPI)
+            - Vue.js 3
+            - PostgreSQL
+            - Docker
+
+            Bonus:
+            - Data visualization
+            - ML/AI experience
+            """,
+            "url": "https://example.com/jobs/fullstack-vue-3",
+            "posted_date": "2025-10-17",
+            "source": "direct"
+        },
+        {
+            "title": "Junior Python Developer",
+            "company": "FinTech Solutions",
+            "location": "Tel Aviv, Israel",
+            "description": """
+            Great opportunity for junior developers!
+
+            Requirements:
+            - 1-2 years Python experience
+            - Understanding of OOP
+            - Basic SQL knowledge
+            - Willingness to learn
+
+            We'll teach you:
+            - Modern Python frameworks
+            - Cloud technologies
+            - DevOps practices
+            """,
+            "url": "https://example.com/jobs/junior-python-4",
+            "posted_date": "2025-10-20",
+            "source": "linkedin"
+        },
+        {
+            "title": "Python AI/ML Engineer",
+            "company": "AI Innovations",
+            "location": "Remote",
+            "description": """
+            Build the future of AI with us!
+
+            Requirements:
+            - Strong Python skills
+            - LangChain, OpenAI API experience
+            - Vector databases (Pinecone, Weaviate)
+            - REST APIs
+
+            Exciting work:
+            - LLM applications
+            - Multi-agent systems
+            - RAG implementations
+            """,
+            "url": "https://example.com/jobs/ai-ml-engineer-5",
+            "posted_date": "2025-10-21",
+            "source": "direct"
+        },
+        {
+            "title": "DevOps Engineer (Python)",
+            "company": "CloudTech",
+            "location": "Raanana, Israel",
+            "description": """
+            DevOps role with strong Python automation focus.
+
+            Requirements:
+            - Python scripting
+            - Docker, Kubernetes
+            - AWS/Azure/GCP
+            - CI/CD (Jenkins, GitLab)
+            - Terraform, Ansible
+
+            You'll work on:
+            - Infrastructure automation
+            - Monitoring systems
+            - Deployment pipelines
+            """,
+            "url": "https://example.com/jobs/devops-python-6",
+            "posted_date": "2025-10-16",
+            "source": "indeed"
+        }
+    )
+)
+
 
 class JobScraper:
     """
@@ -44,7 +350,7 @@ class JobScraper:
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
 
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        self.openai_client = _get_openai_client(openai_api_key)
         print("✅ OpenAI initialized (for smart query expansion)")
 
         # JSearch setup
@@ -58,6 +364,12 @@ class JobScraper:
             self.use_jsearch = True
             print("✅ JSearch API initialized")
 
+        # Shared async HTTP client for JSearch: keeps connections alive across expanded queries
+        self._http = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+
         # Brave Search setup
         self.use_brave_search = use_brave_search
         if use_brave_search:
@@ -78,6 +390,10 @@ class JobScraper:
                 print(f"⚠️  FireCrawl not available: {e}")
                 self.use_firecrawl = False
 
+    async def aclose(self):
+        """Close the shared HTTP client (call once the scraper is no longer needed)"""
+        await self._http.aclose()
+
     def _expand_job_query(self, user_query: str, experience_level: str = "Mid") -> List[str]:
         """
         Expand informal user query to formal job titles using OpenAI
@@ -95,46 +411,34 @@ class JobScraper:
         """
         print(f"🤖 Expanding query: '{user_query}' (Level: {experience_level})...")
 
-        # Adjust prompt based on experience level
-        level_guidance = {
-            "Junior": "Focus on entry-level positions like: Junior, Associate, Entry Level, Graduate roles",
-            "Mid": "Focus on mid-level positions like: Developer, Engineer, Specialist (no seniority prefix)",
-            "Senior": "Focus on senior positions like: Senior, Lead, Principal, Staff Engineer",
-            "Lead": "Focus on leadership positions like: Lead, Principal, Staff, Engineering Manager"
-        }
-
-        guidance = level_guidance.get(experience_level, level_guidance["Mid"])
+        # Return cached expansion if this query was already expanded
+        cache_key = _expansion_cache_key(user_query, experience_level)
+        with _expansion_cache_lock:
+            cached = _expansion_cache.get(cache_key)
+            if cached is not None:
+                _expansion_cache.move_to_end(cache_key)
+        if cached is not None:
+            print(f"   ⚡ Cached expansion: {', '.join(cached)}")
+            return list(cached)
 
-        prompt = f"""
-You are a job search expert. Convert this job search query into 3-5 formal, professional job titles appropriate for a {experience_level} level candidate.
+        guidance = _LEVEL_GUIDANCE.get(experience_level, _LEVEL_GUIDANCE["Mid"])
 
-User query: "{user_query}"
+        prompt = f"""User query: "{user_query}"
 Experience Level: {experience_level}
 
 {guidance}
 
-Return ONLY a JSON array of formal job titles, nothing else.
-
-Example for Junior level:
-User query: "Backend Developer"
-Output: ["Junior Backend Developer", "Backend Developer - Entry Level", "Associate Backend Engineer", "Backend Software Engineer - Junior"]
-
-Example for Mid level:
-User query: "Backend Developer"
-Output: ["Backend Developer", "Backend Software Engineer", "Server-Side Developer", "Backend Engineer"]
-
-Example for Senior level:
-User query: "Backend Developer"
-Output: ["Senior Backend Developer", "Senior Backend Engineer", "Lead Backend Developer", "Principal Backend Engineer"]
-
 Now convert for {experience_level} level: "{user_query}"
 Output:
 """
 
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
+                model=_EXPANSION_MODEL,
+                messages=[
+                    {"role": "system", "content": _EXPAND_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
                 temperature=0.7,
                 timeout=30
             )
@@ -148,7 +452,13 @@ Output:
                 result = '\n'.join(lines[1:-1]).strip()
 
             # Parse JSON array
-            job_titles = json.loads(result)
+            job_titles = orjson.loads(result)
+
+            # Cache successful expansions only (fallbacks are retried next time)
+            with _expansion_cache_lock:
+                _expansion_cache[cache_key] = list(job_titles)
+                if len(_expansion_cache) > _EXPANSION_CACHE_SIZE:
+                    _expansion_cache.popitem(last=False)
 
             print(f"   ✅ Expanded to {len(job_titles)} queries: {', '.join(job_titles)}")
             return job_titles
@@ -173,164 +483,50 @@ Output:
         Returns:
             List of Job objects
         """
-        # Mock data - realistic job postings
-        mock_jobs_data = [
-            {
-                "title": "Senior Python Developer",
-                "company": "TechCorp Israel",
-                "location": "Tel Aviv, Israel",
-                "description": """
-                We're looking for a Senior Python Developer to join our backend team.
-
-                Requirements:
-                - 5+ years of Python experience
-                - Strong knowledge of Django/FastAPI
-                - Experience with PostgreSQL, Redis
-                - Docker, Kubernetes experience
-                - AWS/GCP knowledge
-
-                Nice to have:
-                - Microservices architecture
-                - Event-driven systems
-                - LLM integration experience
-                """,
-                "url": "https://example.com/jobs/senior-python-dev-1",
-                "posted_date": "2025-10-18",
-                "source": "linkedin"
-            },
-            {
-                "title": "Python Backend Engineer",
-                "company": "StartupXYZ",
-                "location": "Remote (Israel)",
-                "description": """
-                Join our fast-growing startup as a Backend Engineer!
-
-                Requirements:
-                - 3+ years Python experience
-                - REST API design
-                - SQL databases
-                - Git, CI/CD
-
-                We offer:
-                - Remote work
-                - Equity
-                - Learning budget
-                """,
-                "url": "https://example.com/jobs/python-backend-2",
-                "posted_date": "2025-10-19",
-                "source": "indeed"
-            },
-            {
-                "title": "Full Stack Developer (Python + Vue.js)",
-                "company": "DataScience Ltd",
-                "location": "Herzliya, Israel",
-                "description": """
-                Looking for a Full Stack Developer with Python and Vue.js experience.
-
-                Requirements:
-                - Python (Flask/FastAPI)
-                - Vue.js 3
-                - PostgreSQL
-                - Docker
-
-                Bonus:
-                - Data visualization
-                - ML/AI experience
-                """,
-                "url": "https://example.com/jobs/fullstack-vue-3",
-                "posted_date": "2025-10-17",
-                "source": "direct"
-            },
-            {
-                "title": "Junior Python Developer",
-                "company": "FinTech Solutions",
-                "location": "Tel Aviv, Israel",
-                "description": """
-                Great opportunity for junior developers!
-
-                Requirements:
-                - 1-2 years Python experience
-                - Understanding of OOP
-                - Basic SQL knowledge
-                - Willingness to learn
-
-                We'll teach you:
-                - Modern Python frameworks
-                - Cloud technologies
-                - DevOps practices
-                """,
-                "url": "https://example.com/jobs/junior-python-4",
-                "posted_date": "2025-10-20",
-                "source": "linkedin"
-            },
-            {
-                "title": "Python AI/ML Engineer",
-                "company": "AI Innovations",
-                "location": "Remote",
-                "description": """
-                Build the future of AI with us!
-
-                Requirements:
-                - Strong Python skills
-                - LangChain, OpenAI API experience
-                - Vector databases (Pinecone, Weaviate)
-                - REST APIs
-
-                Exciting work:
-                - LLM applications
-                - Multi-agent systems
-                - RAG implementations
-                """,
-                "url": "https://example.com/jobs/ai-ml-engineer-5",
-                "posted_date": "2025-10-21",
-                "source": "direct"
-            },
-            {
-                "title": "DevOps Engineer (Python)",
-                "company": "CloudTech",
-                "location": "Raanana, Israel",
-                "description": """
-                DevOps role with strong Python automation focus.
-
-                Requirements:
-                - Python scripting
-                - Docker, Kubernetes
-                - AWS/Azure/GCP
-                - CI/CD (Jenkins, GitLab)
-                - Terraform, Ansible
-
-                You'll work on:
-                - Infrastructure automation
-                - Monitoring systems
-                - Deployment pipelines
-                """,
-                "url": "https://example.com/jobs/devops-python-6",
-                "posted_date": "2025-10-16",
-                "source": "indeed"
-            }
+        location_filter = location.lower() if location else None
+
+        # Templates were validated at import, so skip per-field validation here
+        return [
+            Job.model_construct(**template)
+            for template in _MOCK_JOB_TEMPLATES[:num_jobs]
+            if not location_filter or location_filter in template["location"].lower()
         ]
 
-        # Create Job objects from mock data
-        jobs = []
-        for job_data in mock_jobs_data[:num_jobs]:
-            # Filter by location if specified
-            if location and location.lower() not in job_data["location"].lower():
-                continue
+    async def _search_jsearch_api(self, job_title: str, location: Optional[str] = None, num_jobs: int = 20) -> List[Job]:
+        """
+        Search jobs using JSearch API, serving repeated searches from a TTL cache
 
-            job = Job(
-                title=job_data["title"],
-                company=job_data["company"],
-                location=job_data["location"],
-                description=job_data["description"].strip(),
-                url=job_data["url"],
-                posted_date=job_data.get("posted_date"),
-                source=job_data.get("source", "direct")
-            )
-            jobs.append(job)
+        Results are cached for JSEARCH_CACHE_TTL seconds (default: 600).
 
-        return jobs
+        Args:
+            job_title: Job title to search for
+            location: Optional location filter
+            num_jobs: Number of jobs to return
 
-    async def _search_jsearch_api(self, job_title: str, location: Optional[str] = None, num_jobs: int = 20) -> List[Job]:
+        Returns:
+            List of Job objects
+        """
+        cache_key = (job_title, location, num_jobs)
+        with _jsearch_cache_lock:
+            cached = _jsearch_cache.get(cache_key)
+            hit = cached is not None and time.monotonic() - cached[0] < _JSEARCH_CACHE_TTL
+            if hit:
+                _jsearch_cache.move_to_end(cache_key)
+        if hit:
+            print(f"   ⚡ JSearch cache hit: '{job_title}'")
+            return list(cached[1])
+
+        jobs = await self._fetch_jsearch_api(job_title, location, num_jobs)
+
+        with _jsearch_cache_lock:
+            _jsearch_cache[cache_key] = (time.monotonic(), jobs)
+            _jsearch_cache.move_to_end(cache_key)
+            if len(_jsearch_cache) > _JSEARCH_CACHE_SIZE:
+                _jsearch_cache.popitem(last=False)
+
+        return list(jobs)
+
+    async def _fetch_jsearch_api(self, job_title: str, location: Optional[str] = None, num_jobs: int = 20) -> List[Job]:
         """
         Search jobs using JSearch API (RapidAPI) with smart fallback strategy
 
@@ -342,8 +538,6 @@ Output:
         Returns:
             List of Job objects
         """
-        import requests
-
         url = "https://jsearch.p.rapidapi.com/search"
 
         headers = {
@@ -360,14 +554,15 @@ Output:
                 "query": query,
                 "page": "1",
                 "num_pages": "1",
-                "date_posted": "all"
+                "date_posted": "all",
+                "fields": _JSEARCH_FIELDS
             }
 
-            response = requests.get(url, headers=headers, params=params)
+            response = await self._http.get(url, headers=headers, params=params)
             print(f"   📊 API Status Code: {response.status_code}")
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 jobs_data = data.get("data", [])
                 print(f"   ✅ Strategy 1 returned {len(jobs_data)} jobs")
 
@@ -383,13 +578,14 @@ Output:
                     "page": "1",
                     "num_pages": "1",
                     "date_posted": "all",
-                    "remote_jobs_only": "true"
+                    "remote_jobs_only": "true",
+                    "fields": _JSEARCH_FIELDS
                 }
 
-                response = requests.get(url, headers=headers, params=params)
+                response = await self._http.get(url, headers=headers, params=params)
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     jobs_data = data.get("data", [])
                     print(f"   ✅ Strategy 2 returned {len(jobs_data)} jobs")
 
@@ -403,10 +599,11 @@ Output:
             "query": job_title,
             "page": "1",
             "num_pages": "1",
-            "date_posted": "all"
+            "date_posted": "all",
+            "fields": _JSEARCH_FIELDS
         }
 
-        response = requests.get(url, headers=headers, params=params)
+        response = await self._http.get(url, headers=headers, params=params)
         print(f"   📊 API Status Code: {response.status_code}")
 
         if response.status_code != 200:
@@ -414,7 +611,7 @@ Output:
             print(f"   📝 Response: {response.text[:200]}")
             raise Exception(f"JSearch API error: {response.status_code} - {response.text}")
 
-        data = response.json()
+        data = orjson.loads(response.content)
         jobs_data = data.get("data", [])
         print(f"   ✅ Strategy 3 returned {len(jobs_data)} jobs")
 
@@ -426,6 +623,33 @@ Output:
 
         return self._convert_to_jobs(jobs_data, num_jobs)
 
+    async def _search_jsearch_api_batch(self, job_titles: List[str], location: Optional[str] = None, num_jobs: int = 20) -> List[Job]:
+        """
+        Search JSearch for several job titles with a single request
+
+        The expanded titles are combined into one OR query
+        (e.g. '("Python Developer" OR "Python Engineer")') instead of issuing one
+        request per title. Uses the same fallback strategy as _search_jsearch_api.
+
+        Args:
+            job_titles: Job titles to search for
+            location: Optional location filter
+            num_jobs: Number of jobs to return
+
+        Returns:
+            List of Job objects
+        """
+        if len(job_titles) == 1:
+            combined_query = job_titles[0]
+        else:
+            # JSearch forwards the query to Google for Jobs, which understands Google
+            # search operators (quoted phrases, OR, parentheses). Group the titles so the
+            # " in <location>" / " remote" the strategies append applies to all of them.
+            combined = " OR ".join(f'"{title}"' for title in job_titles)
+            combined_query = f"({combined})"
+
+        return await self._search_jsearch_api(combined_query, location, num_jobs)
+
     def _convert_to_jobs(self, jobs_data: list, num_jobs: int) -> List[Job]:
         """
         Convert JSearch API response to Job objects
@@ -626,61 +850,42 @@ Output:
         # Step 2: Search each expanded query across multiple sources
         jobs_per_query = max(5, jobs_per_source // len(expanded_queries))  # Get at least 5 per query
 
-        for i, query in enumerate(expanded_queries, 1):
-            print(f"\n📋 Query {i}/{len(expanded_queries)}: '{query}'")
-
-            # Search JSearch if available
-            if self.use_jsearch:
-                try:
-                    jsearch_jobs = await self._search_jsearch_api(query, location, jobs_per_query)
-                    jsearch_all_jobs.extend(jsearch_jobs)
-                    print(f"   ✅ JSearch: {len(jsearch_jobs)} jobs")
-                except Exception as e:
-                    print(f"   ⚠️  JSearch failed: {e}")
-
-            # Search Brave Search if available
-            if self.use_brave_search:
-                try:
-                    brave_jobs = await self.brave_agent.search_jobs(query, location, jobs_per_query)
-                    brave_all_jobs.extend(brave_jobs)
-                    print(f"   ✅ Brave Search: {len(brave_jobs)} jobs")
-                except Exception as e:
-                    print(f"   ⚠️  Brave Search failed: {e}")
-
-            # Search FireCrawl if available
-            if self.use_firecrawl:
-                try:
-                    firecrawl_jobs = await self.firecrawl_scraper.search(query, location, jobs_per_query)
-                    firecrawl_all_jobs.extend(firecrawl_jobs)
-                    print(f"   ✅ FireCrawl: {len(firecrawl_jobs)} jobs")
-                except Exception as e:
-                    print(f"   ⚠️  FireCrawl failed: {e}")
+        # (source name, result list, search coroutine function) for per-query sources
+        active_searches = []
+        if self.use_brave_search:
+            active_searches.append(("Brave Search", brave_all_jobs, self.brave_agent.search_jobs))
+        if self.use_firecrawl:
+            active_searches.append(("FireCrawl", firecrawl_all_jobs, self.firecrawl_scraper.search))
+
+        # Fan out every search concurrently
+        labels = []
+        tasks = []
+
+        # JSearch takes all expanded queries in one OR-combined request
+        if self.use_jsearch:
+            labels.append((" OR ".join(expanded_queries), "JSearch", jsearch_all_jobs))
+            tasks.append(self._search_jsearch_api_batch(expanded_queries, location, jobs_per_source))
+
+        for query in expanded_queries:
+            for source_name, source_jobs, search_fn in active_searches:
+                labels.append((query, source_name, source_jobs))
+                tasks.append(search_fn(query, location, jobs_per_query))
+
+        print(f"\n📋 Running {len(tasks)} searches in parallel ({len(expanded_queries)} queries, {active_sources} sources)")
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Collect results in query order; one failing source doesn't stop the others
+        for (query, source_name, source_jobs), result in zip(labels, results):
+            if isinstance(result, Exception):
+                print(f"   ⚠️  {source_name} failed for '{query}': {result}")
+                continue
+            source_jobs.extend(result)
+            print(f"   ✅ {source_name} '{query}': {len(result)} jobs")
 
         # Step 3: Deduplicate each source separately
-        def deduplicate_jobs(jobs_list):
-            seen_urls = set()
-            seen_jobs = set()
-            unique = []
-
-            for job in jobs_list:
-                job_id = (job.title.lower(), job.company.lower())
-
-                if job.url and job.url in seen_urls:
-                    continue
-                if job_id in seen_jobs:
-                    continue
-
-                if job.url:
-                    seen_urls.add(job.url)
-                seen_jobs.add(job_id)
-                unique.append(job)
-
-            return unique
-
-        # Deduplicate each source
-        jsearch_unique = deduplicate_jobs(jsearch_all_jobs)
-        brave_unique = deduplicate_jobs(brave_all_jobs)
-        firecrawl_unique = deduplicate_jobs(firecrawl_all_jobs)
+        jsearch_unique = _deduplicate_jobs(jsearch_all_jobs)
+        brave_unique = _deduplicate_jobs(brave_all_jobs)
+        firecrawl_unique = _deduplicate_jobs(firecrawl_all_jobs)
 
         # Step 4: Distribute jobs evenly from all active sources
         final_jobs = []
@@ -4,7 +4,19 @@ Matches CV to jobs using embeddings and intelligent scoring
 """
 
 import os
-from typing import List, Tuple
+import re
+import math
+import bisect
+import threading
+import asyncio
+import hashlib
+import zipfile
+import tempfile
+import functools
+from collections import OrderedDict
+from pathlib import Path
+from typing import FrozenSet, List, Optional, Tuple
+import numpy as np
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -13,6 +25,102 @@ from models.models import CVAnalysis, Job, CompanyInsights, JobMatch
 # Load environment variables
 load_dotenv()
 
+# Embedding cache keyed on sha256(model, cleaned text), shared by all SmartMatcher
+# instances (the API server builds a fresh pipeline per request). Bounded LRU in memory,
+# plus optional .npz files under EMBEDDING_CACHE_DIR so identical texts are not re-embedded across runs.
+# Entries are int8-quantized (see _quantize): ~1.5 KB per 1536-d vector instead of a ~50 KB list of floats.
+_EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+# Embeddings are fetched in worker threads (see match_and_rank), so LRU updates take a lock
+_embedding_cache_lock = threading.Lock()
+_EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR")
+
+
+# Common skills to check for in job descriptions (that might be missing from CV),
+# paired with their lowercase form once at import
+_COMMON_TECH_SKILLS = tuple((skill, skill.lower()) for skill in (
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++",
+    "Docker", "Kubernetes", "AWS", "Azure", "GCP",
+    "React", "Vue", "Angular", "Node.js",
+    "PostgreSQL", "MongoDB", "Redis",
+    "Kafka", "RabbitMQ", "GraphQL", "REST",
+    "CI/CD", "Jenkins", "GitLab", "GitHub Actions",
+    "Terraform", "Ansible", "Linux"
+))
+
+
+@functools.lru_cache(maxsize=256)
+def _skill_index(cv_skills: Tuple[str, ...]) -> Tuple[Tuple[str, ...], FrozenSet[str], "re.Pattern"]:
+    """
+    Lowercased CV skills (in order and as a set) plus one compiled alternation of them as
+    whole words, so each CV is lowercased once and a description is scanned once for all
+    of its skills (longest first, so "javascript" wins over "java")
+    """
+    skills_lower = tuple(skill.lower() for skill in cv_skills)
+    alternatives = sorted(set(skills_lower), key=len, reverse=True)
+    pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, alternatives)) + r')\b')
+    return skills_lower, frozenset(skills_lower), pattern
+
+
+# Recommendation bands: score >= 80 Strong Match, >= 65 Good Fit, >= 50 Consider, else Skip.
+# Looked up with bisect_right, so each threshold belongs to the band above it.
+_RECOMMENDATION_THRESHOLDS = (50, 65, 80)
+_RECOMMENDATION_LABELS = ("Skip", "Consider", "Good Fit", "Strong Match")
+
+# Embedding input limit in characters (embeddings have max tokens)
+_MAX_EMBEDDING_CHARS = 8000
+
+
+def _clean_text(text: str) -> str:
+    """
+    Collapse whitespace runs to single spaces and cut to _MAX_EMBEDDING_CHARS
+
+    Only a 2x prefix is collapsed first: the collapse of a prefix is always a prefix of
+    the full collapse, so a long enough result is exact without scanning the tail.
+    """
+    prefix = text[:2 * _MAX_EMBEDDING_CHARS]
+    cleaned = " ".join(prefix.split())
+    if len(cleaned) < _MAX_EMBEDDING_CHARS and len(prefix) < len(text):
+        # Whitespace-heavy prefix: fall back to the whole text
+        cleaned = " ".join(text.split())
+    return cleaned[:_MAX_EMBEDDING_CHARS]
+
+
+def _quantize(embedding: List[float]) -> Tuple[np.ndarray, float]:
+    """
+    Symmetric int8 quantization with a per-vector scale
+
+    Error is at most scale / 2 per component, which moves cosine similarity by ~1e-3.
+    """
+    v = np.asarray(embedding, dtype=np.float32)
+    peak = float(np.abs(v).max()) if v.size else 0.0
+    scale = peak / 127 if peak else 1.0
+    return np.round(v / scale).astype(np.int8), scale
+
+
+def _dequantize(quantized: np.ndarray, scale: float) -> List[float]:
+    """Inverse of _quantize"""
+    return (quantized.astype(np.float32) * scale).tolist()
+
+
+def _embedding_cache_key(model: str, text: str) -> str:
+    """Content hash identifying an embedding of (already cleaned) text"""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _embedding_cache_path(model: str, key: str) -> Optional[Path]:
+    """On-disk location of a cached embedding, or None when the disk cache is disabled"""
+    if not _EMBEDDING_CACHE_DIR:
+        return None
+    return Path(_EMBEDDING_CACHE_DIR) / model / f"{key}.npz"
+
+
+def _unit(vec) -> np.ndarray:
+    """Return vec as a float32 unit vector (zero vectors stay zero)"""
+    v = np.asarray(vec, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
+
 
 class SmartMatcher:
     """
@@ -49,12 +157,8 @@ class SmartMatcher:
             embedding = self._create_embedding("Python developer with 3 years experience")
             # Returns: [0.23, -0.45, 0.67, ...] (1536 numbers)
         """
-        # Clean text - remove extra whitespace
-        text = " ".join(text.split())
-
-        # Limit text length (embeddings have max tokens)
-        if len(text) > 8000:
-            text = text[:8000]
+        # Clean text - remove extra whitespace, limit length (embeddings have max tokens)
+        text = _clean_text(text)
 
         # Call OpenAI embeddings API
         response = self.client.embeddings.create(
@@ -72,6 +176,8 @@ class SmartMatcher:
         Create embeddings for multiple texts in a single API call (BATCH)
 
         This is 10x more efficient than calling _create_embedding() in a loop!
+        Texts already embedded (same model, same cleaned text) come from the cache
+        and are left out of the API call.
 
         Args:
             texts: List of texts to embed (e.g., multiple job descriptions)
@@ -85,29 +191,84 @@ class SmartMatcher:
             # Returns: [[0.23, -0.45, ...], [0.12, 0.34, ...], [0.56, -0.78, ...]]
             # One API call instead of 3!
         """
-        # Clean all texts
-        cleaned_texts = []
-        for text in texts:
-            # Remove extra whitespace
-            text = " ".join(text.split())
-            # Limit text length (embeddings have max tokens)
-            if len(text) > 8000:
-                text = text[:8000]
-            cleaned_texts.append(text)
-
-        # Call OpenAI embeddings API with batch
-        # This is the magic - one API call for ALL texts!
-        response = self.client.embeddings.create(
-            input=cleaned_texts,  # Pass list instead of single string
-            model=self.embedding_model
-        )
+        # Clean all texts (collapse whitespace, limit length)
+        cleaned_texts = [_clean_text(text) for text in texts]
+
+        keys = [_embedding_cache_key(self.embedding_model, text) for text in cleaned_texts]
+
+        # Serve what we can from the cache; collect unique misses
+        embeddings = [self._get_cached_embedding(key) for key in keys]
+        misses = {}
+        for key, text, embedding in zip(keys, cleaned_texts, embeddings):
+            if embedding is None:
+                misses.setdefault(key, text)
+
+        if misses:
+            # Call OpenAI embeddings API with batch (cache misses only)
+            # This is the magic - one API call for ALL texts!
+            response = self.client.embeddings.create(
+                input=list(misses.values()),  # Pass list instead of single string
+                model=self.embedding_model
+            )
+
+            # response.data is a list of embedding objects, in input order
+            fetched = dict(zip(misses, (item.embedding for item in response.data)))
+            for key, embedding in fetched.items():
+                self._store_cached_embedding(key, _quantize(embedding))
 
-        # Extract all embedding vectors
-        # response.data is a list of embedding objects
-        embeddings = [item.embedding for item in response.data]
+            embeddings = [fetched[key] if embedding is None else embedding for key, embedding in zip(keys, embeddings)]
 
         return embeddings
 
+    def _get_cached_embedding(self, key: str) -> Optional[List[float]]:
+        """Look up an embedding in the in-memory cache, then on disk"""
+        with _embedding_cache_lock:
+            entry = _embedding_cache.get(key)
+            if entry is not None:
+                _embedding_cache.move_to_end(key)
+        if entry is not None:
+            return _dequantize(*entry)
+
+        path = _embedding_cache_path(self.embedding_model, key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with np.load(path) as stored:
+                entry = (stored["quantized"], float(stored["scale"]))
+        except (OSError, ValueError, zipfile.BadZipFile, KeyError) as e:
+            print(f"   ⚠️  Ignoring unreadable embedding cache entry: {e}")
+            return None
+        self._store_cached_embedding(key, entry, persist=False)
+        return _dequantize(*entry)
+
+    def _store_cached_embedding(self, key: str, entry: Tuple[np.ndarray, float], persist: bool = True):
+        """Add a quantized embedding to the in-memory cache (and to disk, if enabled)"""
+        with _embedding_cache_lock:
+            _embedding_cache[key] = entry
+            if len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+
+        path = _embedding_cache_path(self.embedding_model, key)
+        if persist and path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                quantized, scale = entry
+                # Write to a temp file and rename, so a concurrent reader or a killed
+                # process never sees a half-written .npz
+                with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                    try:
+                        np.savez(tmp, quantized=quantized, scale=scale)
+                        tmp.close()
+                        os.replace(tmp.name, path)
+                    except BaseException:
+                        # Don't leave orphan .tmp files behind (e.g. on a full disk)
+                        tmp.close()
+                        os.unlink(tmp.name)
+                        raise
+            except OSError as e:
+                print(f"   ⚠️  Could not write embedding cache: {e}")
+
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
         Calculate cosine similarity between two vectors
@@ -126,30 +287,26 @@ class SmartMatcher:
             similarity = (A · B) / (||A|| × ||B||)
             Where · is dot product, ||A|| is magnitude
         """
-        # Implement cosine similarity using numpy:
-        import numpy as np
-
-        # Convert to numpy arrays
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-
-        # 1. Calculate dot product
-        dot_product = np.dot(vec1, vec2)
-
-        # 2. Calculate magnitude of vec1
-        magnitude1 = np.linalg.norm(vec1)
-
-        # 3. Calculate magnitude of vec2
-        magnitude2 = np.linalg.norm(vec2)
-
-        # 4. Avoid division by zero
-        if magnitude1 == 0 or magnitude2 == 0:
+        # Coerce once to contiguous float32 (accepts lists or arrays) so NumPy
+        # hands the dot product and norms straight to BLAS
+        a = np.asarray(vec1, dtype=np.float32)
+        b = np.asarray(vec2, dtype=np.float32)
+
+        # Squared magnitudes as plain dot products (skips np.linalg.norm's dispatch
+        # overhead); avoid division by zero
+        squared_norms = float(a @ a) * float(b @ b)
+        if squared_norms == 0.0:
             return 0.0
 
-        # 5. Calculate and return cosine similarity
-        similarity = dot_product / (magnitude1 * magnitude2)
+        return float(a @ b) / math.sqrt(squared_norms)
 
-        return float(similarity)
+    def _cosine_similarity_normalized(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
+        """
+        Cosine similarity for vectors already scaled to unit length (see _unit)
+
+        With both norms equal to 1 the formula reduces to the dot product.
+        """
+        return float(vec1 @ vec2)
 
     def _calculate_skill_overlap(
         self,
@@ -175,33 +332,29 @@ class SmartMatcher:
             Returns:
                 (["Python"], ["Kubernetes"])
         """
-        import re
+        # Lowercase the description once; the CV's lowercased skills are cached per CV
         job_desc_lower = job_description.lower()
+        skills_lower, skills_lower_set, skill_pattern = _skill_index(tuple(cv_skills))
 
         # Find overlapping skills (skills from CV that are in job description)
         # Use word boundaries to avoid false matches (e.g., "Java" in "JavaScript")
-        overlapping = []
-        for skill in cv_skills:
-            # Check if skill appears as a whole word in job description
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, job_desc_lower):
-                overlapping.append(skill)
-
-        # Common skills to check for in job description (that might be missing from CV)
-        common_tech_skills = [
-            "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++",
-            "Docker", "Kubernetes", "AWS", "Azure", "GCP",
-            "React", "Vue", "Angular", "Node.js",
-            "PostgreSQL", "MongoDB", "Redis",
-            "Kafka", "RabbitMQ", "GraphQL", "REST",
-            "CI/CD", "Jenkins", "GitLab", "GitHub Actions",
-            "Terraform", "Ansible", "Linux"
-        ]
+        found = set()
+        if cv_skills:
+            found.update(skill_pattern.findall(job_desc_lower))
+
+            # Matches can't overlap in a single scan, so a skill inside another matched
+            # skill ("learning" in "machine learning") gets its own whole-word check
+            for skill in skills_lower:
+                if skill not in found and skill in job_desc_lower:
+                    if re.search(r'\b' + re.escape(skill) + r'\b', job_desc_lower):
+                        found.add(skill)
+
+        overlapping = [skill for skill, skill_lower in zip(cv_skills, skills_lower) if skill_lower in found]
 
         # Find skills mentioned in job but missing from CV
         missing = [
-            skill for skill in common_tech_skills
-            if skill.lower() in job_desc_lower and skill not in cv_skills
+            skill for skill, skill_lower in _COMMON_TECH_SKILLS
+            if skill_lower in job_desc_lower and skill_lower not in skills_lower_set
         ]
 
         return overlapping, missing
@@ -231,6 +384,27 @@ class SmartMatcher:
         # Calculate skill overlap
         overlapping, missing = self._calculate_skill_overlap(cv_skills, job_description)
 
+        return self._score_from_similarity(similarity, cv_skills, overlapping, missing)
+
+    def _score_from_similarity(
+        self,
+        similarity: float,
+        cv_skills: List[str],
+        overlapping: List[str],
+        missing: List[str]
+    ) -> float:
+        """
+        Base match score (0-100) from a precomputed similarity and skill overlap
+
+        Args:
+            similarity: Cosine similarity between CV and job embeddings
+            cv_skills: Skills from CV
+            overlapping: CV skills found in the job description
+            missing: Job skills missing from the CV
+
+        Returns:
+            Base score between 0-100
+        """
         # NEW SCORING SYSTEM - More weight to skills!
         # Base score from similarity (0-50 points) - REDUCED from 70
         score = similarity * 50
@@ -294,14 +468,7 @@ class SmartMatcher:
         Returns:
             Recommendation string: "Strong Match", "Good Fit", "Consider", or "Skip"
         """
-        if score >= 80:
-            return "Strong Match"
-        elif score >= 65:
-            return "Good Fit"
-        elif score >= 50:
-            return "Consider"
-        else:
-            return "Skip"
+        return _RECOMMENDATION_LABELS[bisect.bisect_right(_RECOMMENDATION_THRESHOLDS, score)]
 
     def _generate_reasoning(
         self,
@@ -414,25 +581,37 @@ class SmartMatcher:
         This candidate has strong capabilities in: {', '.join(cv_analysis.skills)}
         """
 
-        cv_embedding = self._create_embedding(cv_text)
-        print(f"   ✅ Rich CV embedding created ({len(cv_embedding)} dimensions with skill emphasis)")
-
-        # Step 2: Create embeddings for ALL jobs in ONE API call (BATCH!)
         matches = []
 
-        # Handle empty jobs list
+        # Handle empty jobs list (nothing to embed)
         if not jobs:
             print(f"   ⚠️  No jobs to match!")
             return matches
 
+        # Step 2: Create embeddings for ALL jobs in ONE API call (BATCH!)
         print(f"   🚀 Creating embeddings for {len(jobs)} jobs (batch mode - 10x faster)...")
         job_texts = [f"{job.title} {job.description}" for job in jobs]
-        job_embeddings = self._create_embeddings_batch(job_texts)
+
+        # The CV rides in the same batch as the jobs: one blocking request, run in a worker
+        # thread to keep the event loop free. The batch cache is keyed by content hash, so a
+        # CV already embedded (same profile, role and location) is not sent again.
+        embeddings = await asyncio.to_thread(self._create_embeddings_batch, [cv_text, *job_texts])
+        cv_embedding, job_embeddings = embeddings[0], embeddings[1:]
+
+        # Normalized once here, so each job's similarity is a plain dot product
+        cv_embedding = _unit(cv_embedding)
+        print(f"   ✅ Rich CV embedding created ({len(cv_embedding)} dimensions with skill emphasis)")
         print(f"   ✅ All job embeddings created in one API call!")
 
-        # Step 3: Match each job with its embedding
+        # All similarities in one matrix-vector product: (N, D) unit job vectors @ unit CV vector.
+        # Kept float32 on purpose: NumPy has no half-precision BLAS, so an fp16 matrix makes
+        # this GEMV ~50x slower (and upcasting first ~20x); compact storage is the int8 cache's job.
+        job_matrix = np.stack([_unit(embedding) for embedding in job_embeddings])
+        similarities = job_matrix @ cv_embedding
+
+        # Step 3: Match each job with its similarity
 
-        for i, (job, job_embedding) in enumerate(zip(jobs, job_embeddings)):
+        for i, (job, similarity) in enumerate(zip(jobs, similarities.tolist())):
             print(f"   🔍 Matching job {i+1}/{len(jobs)}: {job.title} at {job.company}")
 
             # Calculate skill overlap and gaps
@@ -441,12 +620,12 @@ class SmartMatcher:
                 job.description
             )
 
-            # Calculate base score
-            base_score = self._calculate_base_score(
-                cv_embedding,
-                job_embedding,
+            # Calculate base score (reuses the overlap computed above)
+            base_score = self._score_from_similarity(
+                similarity,
                 cv_analysis.skills,
-                job.description
+                skill_overlap,
+                skill_gaps
             )
 
             # Find matching company insights
@@ -495,7 +674,6 @@ class SmartMatcher:
 
 # Example usage (for testing)
 if __name__ == "__main__":
-    import asyncio
     from agents.cv_analyzer import CVAnalyzer
     from agents.job_scraper import JobScraper
     from agents.news_agent import NewsAgent
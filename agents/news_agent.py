@@ -4,7 +4,15 @@ Collects information about companies using FireCrawl web search
 """
 
 import os
-from typing import List, Optional
+import json
+import time
+import asyncio
+import hashlib
+import random
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 from openai import OpenAI
 from firecrawl import FirecrawlApp
@@ -14,6 +22,87 @@ from models.models import CompanyInsights
 # Load environment variables
 load_dotenv()
 
+# TTL cache of get_insights results keyed on (company, role): company research changes
+# slowly, and the same company shows up for many jobs and across runs. Bounded LRU in memory,
+# plus optional JSON files under INSIGHTS_CACHE_DIR so results survive restarts.
+_INSIGHTS_CACHE_TTL = float(os.getenv("INSIGHTS_CACHE_TTL", "86400"))
+_INSIGHTS_CACHE_SIZE = 256
+_insights_cache: "OrderedDict[tuple, Tuple[float, CompanyInsights]]" = OrderedDict()
+# The API server runs each request's pipeline in its own thread, so LRU updates take a lock
+_insights_cache_lock = threading.Lock()
+_INSIGHTS_CACHE_DIR = os.getenv("INSIGHTS_CACHE_DIR")
+# Fallback results (search timed out / failed) are not cached, so the next call retries
+_UNCACHED_SOURCES = ("timeout", "error", "firecrawl_error")
+
+# FireCrawl answers HTTP 429 when the plan's rate limit is hit (easy with concurrent
+# get_insights calls): back off and retry a few times instead of dropping the query
+_RATE_LIMIT_RETRIES = 3
+
+# Keywords for the simple review sentiment analysis
+_POSITIVE_WORDS = ("great", "love", "amazing", "best", "excellent", "good", "happy", "enjoy")
+_NEGATIVE_WORDS = ("bad", "terrible", "worst", "avoid", "horrible", "toxic", "hate", "quit")
+
+
+def _text_sentiment(text_lower: str) -> int:
+    """
+    Score one lowercased review snippet by counting sentiment keywords
+
+    Returns:
+        1 (positive), -1 (negative) or 0 (neutral)
+    """
+    positive_count = sum(1 for word in _POSITIVE_WORDS if word in text_lower)
+    negative_count = sum(1 for word in _NEGATIVE_WORDS if word in text_lower)
+
+    if positive_count > negative_count:
+        return 1
+    elif negative_count > positive_count:
+        return -1
+    return 0
+
+
+def _overall_sentiment(sentiment_scores: List[int]) -> str:
+    """
+    Turn per-snippet scores into an overall sentiment label
+
+    Args:
+        sentiment_scores: Scores from _text_sentiment
+
+    Returns:
+        "positive" / "negative" if the average is beyond +/-0.2, else "neutral"
+    """
+    if not sentiment_scores:
+        return "neutral"
+
+    avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
+    if avg_sentiment > 0.2:
+        return "positive"
+    elif avg_sentiment < -0.2:
+        return "negative"
+    return "neutral"
+
+
+def _insights_cache_path(cache_key: tuple) -> Optional[Path]:
+    """On-disk location of cached insights, or None when the disk cache is disabled"""
+    if not _INSIGHTS_CACHE_DIR:
+        return None
+    digest = hashlib.sha256("\x00".join(cache_key).encode()).hexdigest()
+    return Path(_INSIGHTS_CACHE_DIR) / f"{digest}.json"
+
+
+def _rate_limit_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request
+
+    Honors the Retry-After header when the SDK exposes the response,
+    otherwise exponential backoff (1s, 2s, 4s, ...) plus up to 1s of jitter.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return 2 ** attempt + random.random()
+
 
 class NewsAgent:
     """
@@ -55,6 +144,9 @@ class NewsAgent:
             print("⚠️  Warning: OPENAI_API_KEY not found - AI analysis will be disabled")
             self.openai_client = None
 
+        # Monotonic time before which no FireCrawl request is sent (set on HTTP 429)
+        self._rate_limited_until = 0.0
+
     def _get_mock_insights(self, company_name: str) -> CompanyInsights:
         """
         Generate mock company insights for testing
@@ -209,6 +301,34 @@ class NewsAgent:
             data_source="mock_data"
         )
 
+    async def _firecrawl_search(self, query: str):
+        """
+        Run one FireCrawl search (top 5 results), retrying with backoff on HTTP 429
+
+        The blocking SDK call runs off the event loop so concurrent get_insights calls
+        overlap their HTTP latency. A 429 pauses every search on this agent, not just
+        the one that hit it.
+
+        Args:
+            query: Search query
+
+        Returns:
+            FireCrawl search response
+        """
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            wait = self._rate_limited_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                return await asyncio.to_thread(self.firecrawl.search, query=query, limit=5)
+            except Exception as e:
+                if getattr(e, "status_code", None) != 429 or attempt == _RATE_LIMIT_RETRIES:
+                    raise
+                delay = _rate_limit_delay(e, attempt)
+                print(f"   ⏳ FireCrawl rate limit hit, retrying in {delay:.1f}s")
+                self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+
     async def _search_firecrawl(self, company_name: str) -> CompanyInsights:
         """
         Search web for company information using FireCrawl
@@ -218,6 +338,7 @@ class NewsAgent:
 
         Returns:
             CompanyInsights object with web research data
+            (data_source "firecrawl_error" if every search failed)
         """
         print(f"   🔥 Searching web for '{company_name}'...")
 
@@ -225,6 +346,7 @@ class NewsAgent:
         news_items = []
         culture_notes = []
         sentiment_scores = []
+        failed_queries = 0
 
         try:
             # Search queries for company information - FOCUSED on tech companies and careers
@@ -239,11 +361,7 @@ class NewsAgent:
 
             for query in search_queries:
                 try:
-                    # Use FireCrawl search API
-                    search_results = self.firecrawl.search(
-                        query=query,
-                        limit=5  # Get top 5 results per query
-                    )
+                    search_results = await self._firecrawl_search(query)
 
                     # Extract web results
                     web_results = search_results.web if hasattr(search_results, 'web') and search_results.web else []
@@ -307,18 +425,7 @@ class NewsAgent:
                             highlights.append(text[:500])
 
                             # Simple sentiment analysis
-                            positive_words = ["great", "love", "amazing", "best", "excellent", "good", "happy", "enjoy"]
-                            negative_words = ["bad", "terrible", "worst", "avoid", "horrible", "toxic", "hate", "quit"]
-
-                            positive_count = sum(1 for word in positive_words if word in text_lower)
-                            negative_count = sum(1 for word in negative_words if word in text_lower)
-
-                            if positive_count > negative_count:
-                                sentiment_scores.append(1)
-                            elif negative_count > positive_count:
-                                sentiment_scores.append(-1)
-                            else:
-                                sentiment_scores.append(0)
+                            sentiment_scores.append(_text_sentiment(text_lower))
 
                             # Extract culture notes
                             if any(word in text_lower for word in ["culture", "work-life", "remote", "benefits"]):
@@ -329,8 +436,12 @@ class NewsAgent:
 
                 except Exception as e:
                     print(f"   ⚠️  Error searching '{query}': {e}")
+                    failed_queries += 1
                     continue
 
+            if failed_queries == len(search_queries):
+                raise RuntimeError(f"all {failed_queries} searches failed")
+
         except Exception as e:
             print(f"   ❌ FireCrawl search failed: {e}")
             return CompanyInsights(
@@ -343,16 +454,7 @@ class NewsAgent:
             )
 
         # Determine overall sentiment
-        if sentiment_scores:
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
-            if avg_sentiment > 0.2:
-                sentiment = "positive"
-            elif avg_sentiment < -0.2:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-        else:
-            sentiment = "neutral"
+        sentiment = _overall_sentiment(sentiment_scores)
 
         # If no results found, return neutral insights
         if not highlights and not news_items:
@@ -518,6 +620,9 @@ Write the structured brief now:"""
         """
         Main method: Get company insights with AI-powered analysis
 
+        Results are cached per (company, role) for INSIGHTS_CACHE_TTL seconds (default: 1 day),
+        and also on disk when INSIGHTS_CACHE_DIR is set.
+
         Args:
             company_name: Name of the company to research
             role: The job role being applied for (optional, enables AI analysis)
@@ -541,11 +646,108 @@ Write the structured brief now:"""
                 data_source="skipped"
             )
 
+        cache_key = (company_name.strip().lower(), role or "")
+        cached = self._get_cached_insights(cache_key)
+        if cached is not None:
+            print(f"⚡ Insights cache hit: {company_name}")
+            return cached.model_copy(update={"company_name": company_name})
+
+        insights = await self._fetch_insights(company_name, role)
+        # A missing AI summary (e.g. a transient OpenAI error) would otherwise stick for the whole TTL
+        ai_summary_missing = role and self.openai_client and insights.ai_summary is None
+        if insights.data_source not in _UNCACHED_SOURCES and not ai_summary_missing:
+            self._store_cached_insights(cache_key, insights)
+        return insights
+
+    async def get_insights_batch(
+        self,
+        companies: List[str],
+        role: Optional[str] = None,
+        max_concurrency: int = 8
+    ) -> List[CompanyInsights]:
+        """
+        Get insights for several companies concurrently
+
+        Each distinct company is researched once (duplicates share the result), with at
+        most max_concurrency companies in flight; all searches share this agent's
+        rate-limit backoff.
+
+        Args:
+            companies: Company names to research
+            role: The job role being applied for (optional, enables AI analysis)
+            max_concurrency: Maximum number of companies researched at the same time
+
+        Returns:
+            CompanyInsights for each company, in the same order as companies
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(company_name: str) -> CompanyInsights:
+            async with semaphore:
+                return await self.get_insights(company_name, role=role)
+
+        unique = list(dict.fromkeys(companies))
+        results = await asyncio.gather(*(fetch(company_name) for company_name in unique))
+        by_company = dict(zip(unique, results))
+        return [by_company[company_name] for company_name in companies]
+
+    def _get_cached_insights(self, cache_key: tuple) -> Optional[CompanyInsights]:
+        """Look up insights in the in-memory cache, then on disk"""
+        with _insights_cache_lock:
+            cached = _insights_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _INSIGHTS_CACHE_TTL:
+                _insights_cache.move_to_end(cache_key)
+                return cached[1]
+
+        path = _insights_cache_path(cache_key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            stored = json.loads(path.read_text())
+            if stored["expires_at"] <= time.time():
+                return None
+            insights = CompanyInsights.model_validate(stored["insights"])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"   ⚠️  Ignoring unreadable insights cache entry: {e}")
+            return None
+
+        self._store_cached_insights(cache_key, insights, persist=False)
+        return insights
+
+    def _store_cached_insights(self, cache_key: tuple, insights: CompanyInsights, persist: bool = True):
+        """Add insights to the in-memory cache (and to disk, if enabled)"""
+        with _insights_cache_lock:
+            _insights_cache[cache_key] = (time.monotonic(), insights)
+            _insights_cache.move_to_end(cache_key)
+            if len(_insights_cache) > _INSIGHTS_CACHE_SIZE:
+                _insights_cache.popitem(last=False)
+
+        path = _insights_cache_path(cache_key)
+        if persist and path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({
+                    "expires_at": time.time() + _INSIGHTS_CACHE_TTL,
+                    "insights": insights.model_dump(mode="json")
+                }))
+            except OSError as e:
+                print(f"   ⚠️  Could not write insights cache: {e}")
+
+    async def _fetch_insights(self, company_name: str, role: Optional[str] = None) -> CompanyInsights:
+        """
+        Research a company with FireCrawl (and OpenAI, if a role is given), bypassing the cache
+
+        Args:
+            company_name: Name of the company to research
+            role: The job role being applied for (optional, enables AI analysis)
+
+        Returns:
+            CompanyInsights object (data_source "timeout"/"error" if the search failed)
+        """
         print(f"🔍 Researching company: {company_name}")
 
         # Use FireCrawl with timeout protection
-        import asyncio
-
         try:
             # Set timeout of 60 seconds for FireCrawl search to prevent hanging
             insights = await asyncio.wait_for(
@@ -607,8 +809,6 @@ Write the structured brief now:"""
 
 # Example usage (for testing)
 if __name__ == "__main__":
-    import asyncio
-
     async def test():
         agent = NewsAgent()
 
@@ -62,6 +62,8 @@ class JobFinderPipeline:
         """
         Run the complete job-finding pipeline
 
+        Closes the job scraper's HTTP client when done, so build a new pipeline per run.
+
         Args:
             cv_path: Path to CV PDF file
             job_title: Job title to search for (e.g., "Python Developer")
@@ -87,20 +89,25 @@ class JobFinderPipeline:
         print("🎯 JOB FINDER PIPELINE - START")
         print("=" * 80)
 
-        # Stage 1a: Analyze CV first (to get experience level)
-        print("\n📊 Stage 1a: CV Analysis")
-        print("-" * 80)
+        # The job scraper's HTTP client is only needed through Stage 1b: close it even if a
+        # stage fails, since the API server builds a new pipeline per request
+        try:
+            # Stage 1a: Analyze CV first (to get experience level)
+            print("\n📊 Stage 1a: CV Analysis")
+            print("-" * 80)
 
-        cv_analysis = await self._run_cv_analyzer(cv_path)
+            cv_analysis = await self._run_cv_analyzer(cv_path)
 
-        print(f"\n✅ Stage 1a Complete!")
-        print(f"   CV Analysis: {len(cv_analysis.skills)} skills, {cv_analysis.experience_level} level")
+            print(f"\n✅ Stage 1a Complete!")
+            print(f"   CV Analysis: {len(cv_analysis.skills)} skills, {cv_analysis.experience_level} level")
 
-        # Stage 1b: Search Jobs (using CV experience level for better matching)
-        print(f"\n🔍 Stage 1b: Job Search (targeted to {cv_analysis.experience_level} level)")
-        print("-" * 80)
+            # Stage 1b: Search Jobs (using CV experience level for better matching)
+            print(f"\n🔍 Stage 1b: Job Search (targeted to {cv_analysis.experience_level} level)")
+            print("-" * 80)
 
-        jobs = await self._run_job_scraper(job_title, location, num_jobs, cv_analysis.experience_level)
+            jobs = await self._run_job_scraper(job_title, location, num_jobs, cv_analysis.experience_level)
+        finally:
+            await self.job_scraper.aclose()
 
         print(f"\n✅ Stage 1b Complete!")
         print(f"   Jobs Found: {len(jobs)} jobs (targeted for {cv_analysis.experience_level} level)")
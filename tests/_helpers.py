@@ -0,0 +1,28 @@
+"""
+Test data builders shared by several test modules
+
+Kept out of conftest.py so tests import them from a plain module.
+"""
+
+
+def mk_response(*jobs):
+    """
+    Build a mocked FireCrawl search response
+
+    Args:
+        *jobs: (title, url, description) tuples, optionally with a 4th markdown item
+
+    Returns:
+        Response dict in the {"data": [...]} shape returned by FirecrawlApp.search
+    """
+    return {
+        "data": [
+            {
+                "title": job[0],
+                "url": job[1],
+                "description": job[2],
+                "markdown": job[3] if len(job) > 3 else ""
+            }
+            for job in jobs
+        ]
+    }
@@ -0,0 +1,178 @@
+"""
+Shared pytest fixtures for the Job Finder test suite
+"""
+
+import copy
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+from agents import job_scraper as job_scraper_module
+from agents import matcher as matcher_module
+from agents import news_agent as news_agent_module
+from agents.firecrawl_scraper import FireCrawlJobScraper
+
+
+# Fake API keys set for the whole test session
+TEST_ENV = {
+    "OPENAI_API_KEY": "test_openai_key",
+    "JSEARCH_API_KEY": "test_jsearch_key",
+    "BRAVE_SEARCH_API_KEY": "test_brave_key"
+}
+
+# Real keys (shell / .env, loaded when the agents are imported) that TEST_ENV masks
+_REAL_ENV = {key: os.getenv(key) for key in TEST_ENV}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _set_env():
+    """
+    Set TEST_ENV once per session instead of patching os.environ per test
+
+    Tests that need a key absent use monkeypatch.delenv locally.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in TEST_ENV.items():
+            mp.setenv(key, value)
+        # Never read or write a developer's on-disk embedding / insights cache
+        mp.setattr(matcher_module, "_EMBEDDING_CACHE_DIR", None)
+        mp.setattr(news_agent_module, "_INSIGHTS_CACHE_DIR", None)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_caches():
+    """Keep module-level caches (JobScraper, SmartMatcher, NewsAgent) and the shared OpenAI client from leaking between tests"""
+    yield
+    matcher_module._embedding_cache.clear()
+    job_scraper_module._expansion_cache.clear()
+    job_scraper_module._jsearch_cache.clear()
+    job_scraper_module._get_openai_client.cache_clear()
+    news_agent_module._insights_cache.clear()
+
+
+@pytest.fixture
+def rig():
+    """
+    FireCrawl test rig shared by the FireCrawl and FireCrawl-only JobScraper tests
+
+    Returns a namespace with:
+        - mock_firecrawl: the mocked FirecrawlApp instance
+        - firecrawl_scraper: FireCrawlJobScraper wired to mock_firecrawl
+        - job_scraper: JobScraper configured to use ONLY FireCrawl (same mock)
+    """
+    from agents.job_scraper import JobScraper
+
+    ns = SimpleNamespace(mock_firecrawl=MagicMock())
+
+    with patch.dict(os.environ, {"FIRECRAWL_API_KEY": "fc-test-key-here"}), patch('agents.firecrawl_scraper.FirecrawlApp', return_value=ns.mock_firecrawl), \
+            patch('agents.job_scraper.OpenAI') as mock_openai_cls:
+        ns.firecrawl_scraper = FireCrawlJobScraper()
+        ns.job_scraper = JobScraper(use_brave_search=False, use_firecrawl=True)
+
+    ns.job_scraper.use_jsearch = False  # Disable JSearch
+    ns.job_scraper.openai_client = mock_openai_cls.return_value
+
+    return ns
+
+
+@pytest.fixture(scope="session")
+def _job_scraper_template():
+    """JobScraper built once per session (TEST_ENV keys, OpenAI and Brave Search mocked, FireCrawl off)"""
+    from agents.job_scraper import JobScraper
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("agents.job_scraper.OpenAI", MagicMock())
+        mp.setattr("agents.job_scraper.BraveSearchAgent", MagicMock())
+        return JobScraper(use_firecrawl=False)
+
+
+@pytest.fixture
+def job_scraper(_job_scraper_template):
+    """
+    Per-test copy of the session JobScraper
+
+    Attributes a test reassigns (flags, _expand_job_query, ...) only touch the copy,
+    and the OpenAI / Brave Search mocks are fresh for every test.
+    """
+    scraper = copy.copy(_job_scraper_template)
+    scraper.openai_client = MagicMock()
+    scraper.brave_agent = MagicMock()
+    return scraper
+
+
+class _FakeResp:
+    """Minimal stand-in for an httpx / requests response (much cheaper to build than MagicMock)"""
+
+    __slots__ = ("status_code", "_json", "text", "content")
+
+    def __init__(self, status_code, payload=None, text=None):
+        self.status_code = status_code
+        self._json = payload
+        self.content = orjson.dumps(payload)
+        self.text = text if text is not None else self.content.decode()
+
+    def json(self):
+        return self._json
+
+
+@pytest.fixture(scope="session")
+def make_resp():
+    """
+    Factory for fake HTTP responses
+
+    Usage: mock_get.return_value = make_resp(200, {"data": [...]})
+           make_resp(500, text="Internal Server Error")
+    """
+    return _FakeResp
+
+
+@pytest.fixture
+def live_env(monkeypatch):
+    """Restore the real API keys masked by TEST_ENV, for integration tests"""
+    for key, value in _REAL_ENV.items():
+        if value:
+            monkeypatch.setenv(key, value)
+        else:
+            monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(scope="session")
+def matcher():
+    """
+    SmartMatcher built once per session (TEST_ENV key, OpenAI client mocked)
+
+    It holds no per-test state; tests stub the client with patch.object, which restores it.
+    """
+    from agents.matcher import SmartMatcher
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("agents.matcher.OpenAI", MagicMock())
+        return SmartMatcher()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration (real network calls / paid APIs)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --run-integration is passed"""
+    if config.getoption("--run-integration"):
+        # Real network calls get more than the default timeout from pytest.ini
+        for item in items:
+            if "integration" in item.keywords:
+                item.add_marker(pytest.mark.timeout(120))
+        return
+
+    skip_integration = pytest.mark.skip(reason="integration test: pass --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
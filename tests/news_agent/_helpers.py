@@ -0,0 +1,58 @@
+"""
+Test data shared by the News Agent test modules
+"""
+
+from types import SimpleNamespace
+
+from models.models import CompanyInsights
+
+
+def _make_results(title, description, n=5):
+    """Fake FireCrawl web results for the sentiment tests (.title and .description, as in search_response)"""
+    return [SimpleNamespace(title=title, description=description) for _ in range(n)]
+
+
+POSITIVE_RESULTS = _make_results(
+    "Microsoft is great and amazing. Best company ever!",
+    "I love working here. Excellent culture and great benefits."
+)
+NEGATIVE_RESULTS = _make_results(
+    "BadCorp is terrible. Worst place to work.",
+    "Avoid this company. Toxic culture and horrible management."
+)
+IRRELEVANT_RESULTS = _make_results(
+    "Some random tech discussion",
+    "No mention of the company here at all"
+)
+
+
+def search_response(*results):
+    """
+    Fake FirecrawlApp.search response
+
+    Args:
+        *results: (title, description, url) tuples
+
+    Returns:
+        Object with a .web list of results, as read by NewsAgent._search_firecrawl
+    """
+    return SimpleNamespace(web=[
+        SimpleNamespace(title=title, description=description, url=url)
+        for title, description, url in results
+    ])
+
+
+def lower_joined(insights) -> str:
+    """All reddit_highlights lowercased once into one string, for substring checks"""
+    return " | ".join(insights.reddit_highlights).lower()
+
+
+# Validated once; tests derive variants with model_copy(update=...) (no revalidation)
+BASE_INSIGHTS = CompanyInsights(
+    company_name="TestCorp",
+    reddit_sentiment="neutral",
+    reddit_highlights=[],
+    recent_news=[],
+    culture_notes=[],
+    data_source="firecrawl"
+)
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the News Agent tests (test data lives in tests/news_agent/_helpers.py)
+"""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents import news_agent as news_agent_module
+
+
+@pytest.fixture(scope="session")
+def _news_agent_template():
+    """NewsAgent built once per session (TEST_ENV keys + a FireCrawl key, OpenAI and FireCrawl mocked)"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FIRECRAWL_API_KEY", "fc-test-key-here")
+        mp.setattr(news_agent_module, "OpenAI", MagicMock())
+        mp.setattr(news_agent_module, "FirecrawlApp", MagicMock())
+        return news_agent_module.NewsAgent()
+
+
+@pytest.fixture
+def news_agent(_news_agent_template):
+    """
+    Per-test copy of the session NewsAgent
+
+    Tests may reassign attributes (openai_client = None, _search_firecrawl, ...)
+    without touching the session instance; the OpenAI / FireCrawl mocks are fresh per test.
+    """
+    agent = copy.copy(_news_agent_template)
+    agent.openai_client = MagicMock()
+    agent.firecrawl = MagicMock()
+    return agent
+
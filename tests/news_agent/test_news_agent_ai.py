@@ -0,0 +1,260 @@
+"""
+Unit tests for News Agent: AI insights generation and the main get_insights method
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agents import news_agent as news_agent_module
+from agents.news_agent import NewsAgent
+from tests.news_agent._helpers import BASE_INSIGHTS
+
+
+# Reused across tests instead of building a fresh exception per side_effect
+_API_ERROR = Exception("API Error")
+_TIMEOUT_ERROR = asyncio.TimeoutError()
+
+
+class TestGenerateAIInsights:
+    """Test AI-powered insights generation"""
+
+    @pytest.fixture
+    def agent_with_openai(self, mocker, monkeypatch):
+        """Create test agent with OpenAI enabled"""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "fc-test-key-here")
+        mock_openai = mocker.patch('agents.news_agent.OpenAI')
+        mocker.patch('agents.news_agent.FirecrawlApp')
+
+        agent = NewsAgent()
+        agent.openai_client = mock_openai.return_value
+        return agent
+
+    async def test_generate_ai_insights_success(self, agent_with_openai):
+        """Test successful AI insights generation"""
+        # Mock CompanyInsights
+        insights = BASE_INSIGHTS.model_copy(update={
+            "company_name": "Google",
+            "reddit_sentiment": "positive",
+            "reddit_highlights": [
+                "Great work-life balance",
+                "Excellent benefits and perks",
+                "Challenging technical problems"
+            ],
+            "recent_news": ["Google launches new AI product"],
+            "culture_notes": ["Innovative culture", "Focus on research"]
+        })
+
+        # Mock OpenAI response (plain attribute tree - only read, never asserted on)
+        content = """
+**About Google:**
+• Leading tech company specializing in search, cloud, and AI
+• Known for innovative products used by billions worldwide
+• Strong focus on research and development
+
+**Interview Prep:**
+• Expect algorithmic and system design questions
+• Culture values innovation and collaborative problem-solving
+• Benefits package is highly competitive
+"""
+        mock_response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+        agent_with_openai.openai_client.chat.completions.create.return_value = mock_response
+
+        ai_summary = await agent_with_openai._generate_ai_insights(
+            role="Software Engineer",
+            company_name="Google",
+            insights=insights
+        )
+
+        assert ai_summary is not None
+        assert "Google" in ai_summary
+        assert "Interview Prep" in ai_summary
+
+    async def test_generate_ai_insights_no_openai_client(self, news_agent):
+        """Test AI insights when OpenAI is not available"""
+        news_agent.openai_client = None
+
+        insights = BASE_INSIGHTS.model_copy(update={"reddit_highlights": ["Some info"]})
+
+        ai_summary = await news_agent._generate_ai_insights(
+            role="Developer",
+            company_name="TestCorp",
+            insights=insights
+        )
+
+        assert ai_summary is None
+
+    async def test_generate_ai_insights_no_data(self, agent_with_openai):
+        """Test AI insights when there's no data available"""
+        # No web data, no news
+        insights = BASE_INSIGHTS.model_copy(update={"company_name": "NoDataCorp"})
+
+        ai_summary = await agent_with_openai._generate_ai_insights(
+            role="Engineer",
+            company_name="NoDataCorp",
+            insights=insights
+        )
+
+        # Should return None when no data available
+        assert ai_summary is None
+
+    async def test_generate_ai_insights_openai_error(self, agent_with_openai):
+        """Test handling of OpenAI API errors"""
+        insights = BASE_INSIGHTS.model_copy(update={
+            "reddit_sentiment": "positive",
+            "reddit_highlights": ["Good company"]
+        })
+
+        # Mock OpenAI error
+        agent_with_openai.openai_client.chat.completions.create.side_effect = _API_ERROR
+
+        ai_summary = await agent_with_openai._generate_ai_insights(
+            role="Developer",
+            company_name="TestCorp",
+            insights=insights
+        )
+
+        assert ai_summary is None
+
+
+class TestGetInsightsMainMethod:
+    """Test the main get_insights method"""
+
+    async def test_get_insights_full_workflow(self, news_agent):
+        """Test complete workflow of getting insights"""
+        # Mock _search_firecrawl
+        mock_insights = BASE_INSIGHTS.model_copy(update={
+            "company_name": "Microsoft",
+            "reddit_sentiment": "positive",
+            "reddit_highlights": ["Great benefits", "Good culture"],
+            "recent_news": ["Microsoft expands cloud services"],
+            "culture_notes": ["Collaborative environment"]
+        })
+
+        news_agent._search_firecrawl = AsyncMock(return_value=mock_insights)
+        news_agent.openai_client = None  # Disable AI for this test
+
+        insights = await news_agent.get_insights("Microsoft")
+
+        assert insights.company_name == "Microsoft"
+        assert insights.reddit_sentiment == "positive"
+        assert len(insights.reddit_highlights) > 0
+
+    async def test_get_insights_with_role_triggers_ai(self, news_agent):
+        """Test that providing role triggers AI analysis"""
+        mock_search_insights = BASE_INSIGHTS.model_copy(update={
+            "company_name": "Amazon",
+            "reddit_sentiment": "positive",
+            "reddit_highlights": ["Fast-paced environment"]
+        })
+
+        news_agent._search_firecrawl = AsyncMock(return_value=mock_search_insights)
+        news_agent._generate_ai_insights = AsyncMock(return_value="AI generated summary")
+
+        insights = await news_agent.get_insights("Amazon", role="Backend Developer")
+
+        # Verify AI insights were generated
+        news_agent._generate_ai_insights.assert_called_once()
+        assert insights.ai_summary == "AI generated summary"
+
+    async def test_get_insights_timeout_handling(self, news_agent):
+        """Test handling of FireCrawl search timeout"""
+        # Mock timeout
+        news_agent._search_firecrawl = AsyncMock(side_effect=_TIMEOUT_ERROR)
+        news_agent.openai_client = None
+
+        insights = await news_agent.get_insights("TimeoutCorp")
+
+        assert insights.company_name == "TimeoutCorp"
+        assert insights.reddit_sentiment == "neutral"
+        assert "timed out" in insights.reddit_highlights[0]
+        assert insights.data_source == "timeout"
+
+    async def test_get_insights_error_handling(self, news_agent):
+        """Test handling of FireCrawl search errors"""
+        news_agent._search_firecrawl = AsyncMock(side_effect=_API_ERROR)
+        news_agent.openai_client = None
+
+        insights = await news_agent.get_insights("ErrorCorp")
+
+        assert insights.company_name == "ErrorCorp"
+        assert insights.reddit_sentiment == "neutral"
+        assert insights.data_source == "error"
+
+    async def test_get_insights_cached_per_company(self, news_agent):
+        """Test that repeated lookups for a company are served from the cache"""
+        news_agent._search_firecrawl = AsyncMock(return_value=BASE_INSIGHTS)
+        news_agent.openai_client = None
+
+        first = await news_agent.get_insights("Google")
+        second = await news_agent.get_insights("google")
+
+        news_agent._search_firecrawl.assert_awaited_once()
+        assert second.reddit_highlights == first.reddit_highlights
+        assert second.company_name == "google"
+
+    async def test_get_insights_failures_not_cached(self, news_agent):
+        """Test that a lookup whose searches all failed is retried on the next call"""
+        news_agent.firecrawl.search.side_effect = ConnectionError("network down")
+        news_agent.openai_client = None
+
+        first = await news_agent.get_insights("Acme")
+        calls = news_agent.firecrawl.search.call_count
+        await news_agent.get_insights("Acme")
+
+        assert first.data_source == "firecrawl_error"
+        assert news_agent.firecrawl.search.call_count == 2 * calls
+
+    async def test_get_insights_ai_failure_not_cached(self, news_agent):
+        """Test that insights missing their AI summary after an OpenAI error are regenerated next call"""
+        news_agent._search_firecrawl = AsyncMock(
+            return_value=BASE_INSIGHTS.model_copy(update={"reddit_highlights": ["Great culture"]})
+        )
+        news_agent.openai_client.chat.completions.create.side_effect = [
+            _API_ERROR,
+            SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Interview prep"))])
+        ]
+
+        first = await news_agent.get_insights("Google", role="Backend Developer")
+        second = await news_agent.get_insights("Google", role="Backend Developer")
+
+        assert first.ai_summary is None
+        assert second.ai_summary == "Interview prep"
+        assert news_agent._search_firecrawl.await_count == 2
+
+    async def test_get_insights_disk_cache(self, news_agent, monkeypatch, tmp_path):
+        """Test that insights persisted under INSIGHTS_CACHE_DIR survive a cleared memory cache"""
+        monkeypatch.setattr(news_agent_module, "_INSIGHTS_CACHE_DIR", str(tmp_path))
+        news_agent._search_firecrawl = AsyncMock(return_value=BASE_INSIGHTS)
+        news_agent.openai_client = None
+
+        await news_agent.get_insights("Google")
+        news_agent_module._insights_cache.clear()
+        insights = await news_agent.get_insights("Google")
+
+        news_agent._search_firecrawl.assert_awaited_once()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        assert insights.reddit_highlights == BASE_INSIGHTS.reddit_highlights
+
+    async def test_get_insights_batch(self, news_agent):
+        """Test batch lookup keeps input order and researches duplicates once"""
+        async def fake_search(company_name):
+            return BASE_INSIGHTS.model_copy(update={"company_name": company_name})
+
+        news_agent._search_firecrawl = AsyncMock(side_effect=fake_search)
+        news_agent.openai_client = None
+
+        results = await news_agent.get_insights_batch(["Google", "Meta", "Google"])
+
+        assert [insights.company_name for insights in results] == ["Google", "Meta", "Google"]
+        assert news_agent._search_firecrawl.await_count == 2
+
+
+# Run tests
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
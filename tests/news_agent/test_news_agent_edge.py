@@ -0,0 +1,60 @@
+"""
+Unit tests for News Agent: edge cases and error scenarios
+"""
+
+import pytest
+
+from tests.news_agent._helpers import search_response
+
+
+class TestEdgeCases:
+    """Test edge cases and error scenarios"""
+
+    async def test_empty_company_name(self, news_agent):
+        """Test handling of empty company name"""
+        news_agent.firecrawl.search.return_value = search_response()
+
+        insights = await news_agent._search_firecrawl("")
+
+        assert insights.company_name == ""
+        assert insights.reddit_sentiment == "neutral"
+
+    async def test_special_characters_in_company_name(self, news_agent):
+        """Test handling of special characters in company name"""
+        news_agent.firecrawl.search.return_value = search_response()
+
+        insights = await news_agent._search_firecrawl("Company & Co. Inc.")
+
+        assert insights.company_name == "Company & Co. Inc."
+        assert 'Company & Co. Inc.' in news_agent.firecrawl.search.call_args.kwargs["query"]
+
+    async def test_very_long_company_name(self, news_agent):
+        """Test handling of very long company name"""
+        news_agent.firecrawl.search.return_value = search_response()
+
+        long_name = "A" * 200  # Very long name
+        insights = await news_agent._search_firecrawl(long_name)
+
+        assert insights.company_name == long_name
+
+    def test_mock_insights_handles_all_data_types(self, news_agent):
+        """Test that mock insights properly handles all data types"""
+        insights = news_agent._get_mock_insights("TechCorp Israel")
+
+        # Verify all fields are correct types
+        assert isinstance(insights.company_name, str)
+        assert isinstance(insights.reddit_sentiment, str)
+        assert isinstance(insights.reddit_highlights, list)
+        assert isinstance(insights.recent_news, list)
+        assert isinstance(insights.culture_notes, list)
+        assert isinstance(insights.data_source, str)
+
+        # Verify list contents are strings
+        assert all(isinstance(h, str) for h in insights.reddit_highlights)
+        assert all(isinstance(n, str) for n in insights.recent_news)
+        assert all(isinstance(c, str) for c in insights.culture_notes)
+
+
+# Run tests
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
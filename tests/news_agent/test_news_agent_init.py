@@ -0,0 +1,57 @@
+"""
+Unit tests for News Agent: initialization with different configurations
+"""
+
+import pytest
+
+from agents.news_agent import NewsAgent
+
+
+@pytest.fixture
+def firecrawl_env(mocker, monkeypatch):
+    """FireCrawl key set and the FireCrawl client mocked; returns the mocked FirecrawlApp class"""
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "fc-test-key-here")
+    return mocker.patch('agents.news_agent.FirecrawlApp')
+
+
+class TestNewsAgentInitialization:
+    """Test NewsAgent initialization with different configurations"""
+
+    def test_init_with_all_credentials(self, mocker, firecrawl_env):
+        """Test successful initialization with FireCrawl and OpenAI keys"""
+        mock_openai = mocker.patch('agents.news_agent.OpenAI')
+
+        agent = NewsAgent()
+
+        firecrawl_env.assert_called_once_with(api_key="fc-test-key-here")
+        assert agent.firecrawl is firecrawl_env.return_value
+        mock_openai.assert_called_once_with(api_key="test_openai_key")
+        assert agent.openai_client is mock_openai.return_value
+
+    def test_init_without_firecrawl_key_raises_error(self, monkeypatch):
+        """Test that a missing FireCrawl key raises ValueError"""
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+
+        with pytest.raises(ValueError, match="FIRECRAWL_API_KEY not found"):
+            NewsAgent()
+
+    def test_init_with_empty_firecrawl_key_raises_error(self, monkeypatch):
+        """Test that an empty FireCrawl key raises ValueError"""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "")
+
+        with pytest.raises(ValueError, match="FIRECRAWL_API_KEY not found"):
+            NewsAgent()
+
+    def test_init_without_openai_key_disables_ai(self, monkeypatch, firecrawl_env):
+        """Test initialization without OpenAI disables AI features"""
+        monkeypatch.delenv("OPENAI_API_KEY")
+
+        agent = NewsAgent()
+
+        assert agent.openai_client is None
+        assert agent.firecrawl is firecrawl_env.return_value
+
+
+# Run tests
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,164 @@
+"""
+Unit tests for News Agent: FireCrawl search, rate limiting and sentiment scoring
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agents import news_agent as news_agent_module
+from agents.news_agent import _text_sentiment, _overall_sentiment, _rate_limit_delay
+from tests.news_agent._helpers import POSITIVE_RESULTS, NEGATIVE_RESULTS, IRRELEVANT_RESULTS, search_response
+
+
+# Reused across tests instead of building a fresh exception per side_effect
+_CONN_ERROR = Exception("Connection failed")
+
+
+class _RateLimitError(Exception):
+    """Stand-in for the FireCrawl SDK's HTTP 429 error"""
+    status_code = 429
+    response = None
+
+
+@pytest.mark.fast
+class TestSentimentScoring:
+    """Test the keyword sentiment helpers directly (no search mocking)"""
+
+    @pytest.mark.parametrize("results,expected", [
+        (POSITIVE_RESULTS, "positive"),
+        (NEGATIVE_RESULTS, "negative"),
+        (IRRELEVANT_RESULTS, "neutral"),
+    ])
+    def test_overall_sentiment(self, results, expected):
+        """Test that a set of search results gets the expected overall sentiment"""
+        # Scored on title + description, as _search_firecrawl does
+        scores = [_text_sentiment(f"{result.title}\n{result.description}".lower()) for result in results]
+
+        assert _overall_sentiment(scores) == expected
+
+    def test_overall_sentiment_without_scores_is_neutral(self):
+        """Test that no scored snippets means neutral sentiment"""
+        assert _overall_sentiment([]) == "neutral"
+
+    def test_mixed_snippet_is_neutral(self):
+        """Test that equal positive and negative keywords cancel out"""
+        assert _text_sentiment("great pay but toxic management") == 0
+
+
+class TestSearchFirecrawl:
+    """Test company research via FireCrawl web search"""
+
+    async def test_search_firecrawl_success(self, news_agent):
+        """Test that relevant results become highlights, news and sentiment"""
+        news_agent.firecrawl.search.return_value = search_response(
+            ("Google is a great place to work",
+             "I love the culture at Google. Great work-life balance and benefits.",
+             "https://www.glassdoor.com/Reviews/Google"),
+            ("Google interview experience",
+             "Finished interviews at Google. Amazing team and interesting questions.",
+             "https://www.reddit.com/r/cscareerquestions/google"),
+        )
+
+        insights = await news_agent._search_firecrawl("Google")
+
+        assert insights.company_name == "Google"
+        assert insights.data_source == "firecrawl"
+        assert insights.reddit_sentiment == "positive"
+        assert len(insights.reddit_highlights) > 0
+        assert len(insights.recent_news) > 0
+        assert news_agent.firecrawl.search.call_count == 3
+
+    async def test_search_firecrawl_no_results(self, news_agent):
+        """Test search with no results"""
+        news_agent.firecrawl.search.return_value = search_response()
+
+        insights = await news_agent._search_firecrawl("ObscureCompany999")
+
+        assert insights.company_name == "ObscureCompany999"
+        assert insights.reddit_sentiment == "neutral"
+        assert insights.reddit_highlights == []
+        assert insights.data_source == "firecrawl"
+
+    async def test_search_firecrawl_connection_failure(self, news_agent):
+        """Test that a lookup whose searches all fail is reported as firecrawl_error"""
+        news_agent.firecrawl.search.side_effect = _CONN_ERROR
+
+        insights = await news_agent._search_firecrawl("TestCompany")
+
+        assert insights.company_name == "TestCompany"
+        assert insights.reddit_sentiment == "neutral"
+        assert insights.data_source == "firecrawl_error"
+
+    async def test_search_firecrawl_partial_failure(self, news_agent):
+        """Test that one failed query doesn't discard the others"""
+        news_agent.firecrawl.search.side_effect = [
+            _CONN_ERROR,
+            search_response(("Acme engineering culture review",
+                             "Employees say Acme has a great culture",
+                             "https://www.reddit.com/r/acme")),
+            search_response(),
+        ]
+
+        insights = await news_agent._search_firecrawl("Acme")
+
+        assert insights.data_source == "firecrawl"
+        assert len(insights.reddit_highlights) == 1
+
+    async def test_search_firecrawl_filters_irrelevant_results(self, news_agent):
+        """Test that results not mentioning the company, or from shopping/social sites, are dropped"""
+        news_agent.firecrawl.search.return_value = search_response(
+            ("Some random tech discussion", "No mention of the company here at all",
+             "https://www.reddit.com/r/programming"),
+            ("SpecificCompany hoodie - buy now", "SpecificCompany merch on sale, free shipping",
+             "https://www.etsy.com/listing/1"),
+        )
+
+        insights = await news_agent._search_firecrawl("SpecificCompany")
+
+        assert insights.reddit_highlights == []
+        assert insights.recent_news == []
+
+
+class TestFirecrawlRateLimit:
+    """Test backoff and retry when FireCrawl answers HTTP 429"""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self, monkeypatch):
+        monkeypatch.setattr(news_agent_module, "_rate_limit_delay", lambda error, attempt: 0.0)
+
+    async def test_retries_after_rate_limit(self, news_agent):
+        """Test that a rate-limited search is retried and succeeds"""
+        news_agent.firecrawl.search.side_effect = [_RateLimitError(), "results"]
+
+        assert await news_agent._firecrawl_search("Google reviews") == "results"
+        assert news_agent.firecrawl.search.call_count == 2
+
+    async def test_gives_up_after_max_retries(self, news_agent):
+        """Test that persistent 429s are raised after the retry budget"""
+        news_agent.firecrawl.search.side_effect = _RateLimitError()
+
+        with pytest.raises(_RateLimitError):
+            await news_agent._firecrawl_search("Google reviews")
+        assert news_agent.firecrawl.search.call_count == news_agent_module._RATE_LIMIT_RETRIES + 1
+
+    async def test_other_errors_not_retried(self, news_agent):
+        """Test that non-429 errors are raised immediately"""
+        news_agent.firecrawl.search.side_effect = _CONN_ERROR
+
+        with pytest.raises(Exception, match="Connection failed"):
+            await news_agent._firecrawl_search("Google reviews")
+        news_agent.firecrawl.search.assert_called_once()
+
+    def test_rate_limit_delay_honors_retry_after(self):
+        """Test that Retry-After wins over exponential backoff"""
+        error = _RateLimitError()
+        error.response = SimpleNamespace(headers={"Retry-After": "7"})
+
+        assert _rate_limit_delay(error, attempt=2) == 7.0
+        assert 4.0 <= _rate_limit_delay(_RateLimitError(), attempt=2) < 5.0
+
+
+# Run tests
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
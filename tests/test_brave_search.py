@@ -303,7 +303,6 @@ class TestSearchJobsAPI:
             }
         }
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_success(self, mock_get, mock_response):
@@ -329,7 +328,6 @@ class TestSearchJobsAPI:
         assert jobs[0].title == "Python Developer - TechCorp"
         assert jobs[1].company == "StartupXYZ"
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_api_error(self, mock_get):
@@ -342,7 +340,6 @@ class TestSearchJobsAPI:
 
         assert jobs == []
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_timeout(self, mock_get):
@@ -355,7 +352,6 @@ class TestSearchJobsAPI:
 
         assert jobs == []
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_network_error(self, mock_get):
@@ -368,7 +364,6 @@ class TestSearchJobsAPI:
 
         assert jobs == []
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_max_results_limit(self, mock_get, mock_response):
@@ -383,7 +378,6 @@ class TestSearchJobsAPI:
         call_args = mock_get.call_args
         assert call_args[1]['params']['count'] == 20
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_with_location_filter(self, mock_get, mock_response):
@@ -399,7 +393,6 @@ class TestSearchJobsAPI:
         query = call_args[1]['params']['q']
         assert '"Tel Aviv"' in query
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_empty_results(self, mock_get):
@@ -412,7 +405,6 @@ class TestSearchJobsAPI:
 
         assert jobs == []
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_jobs_malformed_response(self, mock_get):
@@ -430,7 +422,6 @@ class TestSearchJobsAPI:
 class TestSearchJobsForNews:
     """Test news search capabilities (using same search_jobs method)"""
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_tech_news(self, mock_get):
@@ -470,7 +461,6 @@ class TestSearchJobsForNews:
         call_args = mock_get.call_args
         assert "AI technology Israel news" in call_args[1]['params']['q']
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_company_news(self, mock_get):
@@ -497,7 +487,6 @@ class TestSearchJobsForNews:
         assert "Google" in results[0].title
         assert "Tel Aviv" in results[0].description
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_search_freshness_parameter(self, mock_get):
@@ -516,7 +505,6 @@ class TestSearchJobsForNews:
 class TestIntegrationScenarios:
     """Integration tests for real-world scenarios"""
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_full_job_search_workflow(self, mock_get):
@@ -562,7 +550,6 @@ class TestIntegrationScenarios:
         assert jobs[1].company == "Wix.com"
         assert jobs[1].location == "Herzliya"
 
-    @pytest.mark.asyncio
     @patch.dict(os.environ, {"BRAVE_SEARCH_API_KEY": "test_key"})
     @patch('agents.brave_search.requests.get')
     async def test_resilience_to_partial_failures(self, mock_get):
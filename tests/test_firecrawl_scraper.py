@@ -5,12 +5,15 @@ Tests FireCrawl-only job search functionality
 
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-import asyncio
-from typing import List
+from unittest.mock import Mock, patch
 
 from agents.firecrawl_scraper import FireCrawlJobScraper
 from models.models import Job
+from tests._helpers import mk_response
+
+pytestmark = pytest.mark.fast
+
+_LONG_QUERY = "Software Engineer " * 50
 
 
 class TestFireCrawlScraperInitialization:
@@ -38,96 +41,52 @@ class TestFireCrawlScraperInitialization:
 class TestFireCrawlSearch:
     """Test FireCrawl search functionality"""
 
-    @pytest.fixture
-    @patch.dict(os.environ, {
-        "FIRECRAWL_API_KEY": "fc-test-key-here"
-    })
-    @patch('agents.firecrawl_scraper.FirecrawlApp')
-    def scraper(self, mock_firecrawl_cls):
-        """Create test scraper with mocked FireCrawl"""
-        mock_firecrawl_instance = MagicMock()
-        mock_firecrawl_cls.return_value = mock_firecrawl_instance
-
-        scraper = FireCrawlJobScraper()
-        scraper.firecrawl = mock_firecrawl_instance
-        return scraper
-
-    @pytest.mark.asyncio
-    async def test_search_success(self, scraper):
+    async def test_search_success(self, rig):
         """Test successful FireCrawl search"""
         # Mock FireCrawl search response
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "Python Developer at Google - Mountain View, CA",
-                    "url": "https://careers.google.com/jobs/python-dev",
-                    "markdown": "Python developer position at Google...",
-                    "description": "Exciting Python role at Google"
-                },
-                {
-                    "title": "Senior Software Engineer at Microsoft",
-                    "url": "https://careers.microsoft.com/jobs/swe",
-                    "markdown": "Senior software engineering position...",
-                    "description": "Great opportunity at Microsoft"
-                }
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(
+            ("Python Developer at Google - Mountain View, CA", "https://careers.google.com/jobs/python-dev", "Exciting Python role at Google"),
+            ("Senior Software Engineer at Microsoft", "https://careers.microsoft.com/jobs/swe", "Great opportunity at Microsoft")
+        )
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Python Developer",
             location="Remote",
             num_jobs=10
         )
 
         assert len(results) == 2
-        assert all(isinstance(job, Job) for job in results)
         assert results[0].source == "firecrawl"
         assert results[1].source == "firecrawl"
 
         # Verify FireCrawl was called with correct parameters
-        scraper.firecrawl.search.assert_called_once()
-        call_args = scraper.firecrawl.search.call_args
+        rig.mock_firecrawl.search.assert_called_once()
+        call_args = rig.mock_firecrawl.search.call_args
         assert "Python Developer jobs Remote" in call_args.kwargs['query']
 
-    @pytest.mark.asyncio
-    async def test_search_without_location(self, scraper):
+    async def test_search_without_location(self, rig):
         """Test search without location parameter"""
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "AI Engineer at OpenAI",
-                    "url": "https://openai.com/careers/ai-engineer",
-                    "markdown": "AI Engineer role...",
-                    "description": "AI engineering position"
-                }
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(
+            ("AI Engineer at OpenAI", "https://openai.com/careers/ai-engineer", "AI engineering position")
+        )
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="AI Engineer",
             num_jobs=5
         )
 
         assert len(results) == 1
         # Should search for "AI Engineer jobs" without location
-        call_args = scraper.firecrawl.search.call_args
+        call_args = rig.mock_firecrawl.search.call_args
         assert call_args.kwargs['query'] == "AI Engineer jobs"
 
-    @pytest.mark.asyncio
-    async def test_search_parses_title_correctly(self, scraper):
+    async def test_search_parses_title_correctly(self, rig):
         """Test that job titles are parsed correctly"""
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "Backend Developer at Stripe - San Francisco",
-                    "url": "https://stripe.com/jobs/backend-dev",
-                    "markdown": "Backend developer position...",
-                    "description": "Backend role at Stripe"
-                }
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(
+            ("Backend Developer at Stripe - San Francisco", "https://stripe.com/jobs/backend-dev", "Backend role at Stripe")
+        )
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Backend Developer",
             location="San Francisco",
             num_jobs=10
@@ -138,12 +97,11 @@ class TestFireCrawlSearch:
         assert job.company == "Stripe"
         assert job.location == "San Francisco"
 
-    @pytest.mark.asyncio
-    async def test_search_handles_no_results(self, scraper):
+    async def test_search_handles_no_results(self, rig):
         """Test search when FireCrawl returns no results"""
-        scraper.firecrawl.search.return_value = {"data": []}
+        rig.mock_firecrawl.search.return_value = mk_response()
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Nonexistent Job",
             location="Mars",
             num_jobs=10
@@ -151,57 +109,41 @@ class TestFireCrawlSearch:
 
         assert len(results) == 0
 
-    @pytest.mark.asyncio
-    async def test_search_handles_api_error(self, scraper):
+    async def test_search_handles_api_error(self, rig):
         """Test search when FireCrawl API fails"""
-        scraper.firecrawl.search.side_effect = Exception("API Error")
+        rig.mock_firecrawl.search.side_effect = Exception("API Error")
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Software Engineer",
             num_jobs=10
         )
 
         assert len(results) == 0  # Should return empty list on error
 
-    @pytest.mark.asyncio
-    async def test_search_respects_num_jobs_limit(self, scraper):
+    async def test_search_respects_num_jobs_limit(self, rig):
         """Test that search respects the num_jobs parameter"""
         # Return 5 jobs
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": f"Job {i}",
-                    "url": f"https://example.com/job{i}",
-                    "description": f"Job {i} description"
-                }
-                for i in range(5)
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(*(
+            (f"Job {i}", f"https://example.com/job{i}", f"Job {i} description")
+            for i in range(5)
+        ))
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Developer",
             num_jobs=3  # Request only 3
         )
 
         # Should call FireCrawl with limit of 3
-        call_args = scraper.firecrawl.search.call_args
+        call_args = rig.mock_firecrawl.search.call_args
         assert call_args.kwargs['limit'] == 3
 
-    @pytest.mark.asyncio
-    async def test_search_uses_markdown_as_description_fallback(self, scraper):
+    async def test_search_uses_markdown_as_description_fallback(self, rig):
         """Test that markdown is used as description when description is missing"""
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "Data Scientist",
-                    "url": "https://example.com/ds",
-                    "markdown": "This is a detailed markdown description of the job...",
-                    "description": ""  # Empty description
-                }
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(
+            ("Data Scientist", "https://example.com/ds", "", "This is a detailed markdown description of the job...")
+        )
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Data Scientist",
             num_jobs=5
         )
@@ -216,44 +158,15 @@ class TestFireCrawlSearch:
 class TestFireCrawlDeduplication:
     """Test job deduplication in FireCrawl scraper"""
 
-    @pytest.fixture
-    @patch.dict(os.environ, {
-        "FIRECRAWL_API_KEY": "fc-test-key-here"
-    })
-    @patch('agents.firecrawl_scraper.FirecrawlApp')
-    def scraper(self, mock_firecrawl_cls):
-        """Create test scraper"""
-        mock_firecrawl_instance = MagicMock()
-        mock_firecrawl_cls.return_value = mock_firecrawl_instance
-
-        scraper = FireCrawlJobScraper()
-        scraper.firecrawl = mock_firecrawl_instance
-        return scraper
-
-    @pytest.mark.asyncio
-    async def test_deduplication_by_title_and_company(self, scraper):
+    async def test_deduplication_by_title_and_company(self, rig):
         """Test that duplicate jobs are removed"""
-        scraper.firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "Python Developer at Google",
-                    "url": "https://google.com/job1",
-                    "description": "First posting"
-                },
-                {
-                    "title": "Python Developer at Google",  # Duplicate
-                    "url": "https://google.com/job2",  # Different URL
-                    "description": "Second posting"
-                },
-                {
-                    "title": "Python Developer at Microsoft",  # Different company
-                    "url": "https://microsoft.com/job1",
-                    "description": "Different company"
-                }
-            ]
-        }
+        rig.mock_firecrawl.search.return_value = mk_response(
+            ("Python Developer at Google", "https://google.com/job1", "First posting"),
+            ("Python Developer at Google", "https://google.com/job2", "Second posting"),  # Duplicate, different URL
+            ("Python Developer at Microsoft", "https://microsoft.com/job1", "Different company")  # Different company
+        )
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Python Developer",
             num_jobs=10
         )
@@ -264,7 +177,7 @@ class TestFireCrawlDeduplication:
         assert "Google" in companies
         assert "Microsoft" in companies
 
-    def test_deduplicate_jobs_method(self, scraper):
+    def test_deduplicate_jobs_method(self, rig):
         """Test the _deduplicate_jobs method directly"""
         jobs = [
             Job(title="Developer", company="Google", location="US",
@@ -275,7 +188,7 @@ class TestFireCrawlDeduplication:
                 description="Job 2", url="https://microsoft.com/1", source="firecrawl"),
         ]
 
-        unique_jobs = scraper._deduplicate_jobs(jobs)
+        unique_jobs = rig.firecrawl_scraper._deduplicate_jobs(jobs)
 
         assert len(unique_jobs) == 2
 
@@ -283,64 +196,44 @@ class TestFireCrawlDeduplication:
 class TestFireCrawlEdgeCases:
     """Test edge cases and error scenarios"""
 
-    @pytest.fixture
-    @patch.dict(os.environ, {
-        "FIRECRAWL_API_KEY": "fc-test-key-here"
-    })
-    @patch('agents.firecrawl_scraper.FirecrawlApp')
-    def scraper(self, mock_firecrawl_cls):
-        """Create test scraper"""
-        mock_firecrawl_instance = MagicMock()
-        mock_firecrawl_cls.return_value = mock_firecrawl_instance
-
-        scraper = FireCrawlJobScraper()
-        scraper.firecrawl = mock_firecrawl_instance
-        return scraper
-
-    @pytest.mark.asyncio
-    async def test_search_with_special_characters(self, scraper):
+    async def test_search_with_special_characters(self, rig):
         """Test search with special characters in query"""
-        scraper.firecrawl.search.return_value = {"data": []}
+        rig.mock_firecrawl.search.return_value = mk_response()
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="C++ Developer @#$%",
             num_jobs=10
         )
 
         assert isinstance(results, list)
         # Should still make the API call
-        scraper.firecrawl.search.assert_called_once()
+        rig.mock_firecrawl.search.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_search_with_empty_query(self, scraper):
+    async def test_search_with_empty_query(self, rig):
         """Test search with empty query string"""
-        scraper.firecrawl.search.return_value = {"data": []}
+        rig.mock_firecrawl.search.return_value = mk_response()
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="",
             num_jobs=10
         )
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_search_with_very_long_query(self, scraper):
+    async def test_search_with_very_long_query(self, rig):
         """Test search with very long query"""
-        scraper.firecrawl.search.return_value = {"data": []}
-
-        long_query = "Software Engineer " * 50
+        rig.mock_firecrawl.search.return_value = mk_response()
 
-        results = await scraper.search(
-            job_title=long_query,
+        results = await rig.firecrawl_scraper.search(
+            job_title=_LONG_QUERY,
             num_jobs=10
         )
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_search_handles_malformed_response(self, scraper):
+    async def test_search_handles_malformed_response(self, rig):
         """Test search with malformed API response"""
-        scraper.firecrawl.search.return_value = {
+        rig.mock_firecrawl.search.return_value = {
             "data": [
                 {
                     "title": "Valid Job",
@@ -356,7 +249,7 @@ class TestFireCrawlEdgeCases:
             ]
         }
 
-        results = await scraper.search(
+        results = await rig.firecrawl_scraper.search(
             job_title="Developer",
             num_jobs=10
         )
@@ -371,51 +264,18 @@ class TestJobScraperWithFireCrawlOnly:
     This tests the requirement: job_scraper should use ONLY FireCrawl
     """
 
-    @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test-openai-key",
-        "FIRECRAWL_API_KEY": "fc-test-key-here"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.firecrawl_scraper.FirecrawlApp')
-    def scraper_firecrawl_only(self, mock_firecrawl_cls, mock_openai_cls):
-        """Create JobScraper configured to use ONLY FireCrawl"""
-        from agents.job_scraper import JobScraper
-
-        # Mock OpenAI
-        mock_openai_instance = MagicMock()
-        mock_openai_cls.return_value = mock_openai_instance
-
-        # Mock FireCrawl
-        mock_firecrawl_instance = MagicMock()
-        mock_firecrawl_cls.return_value = mock_firecrawl_instance
-
-        # Create scraper with ONLY FireCrawl enabled
-        scraper = JobScraper(use_brave_search=False, use_firecrawl=True)
-        scraper.use_jsearch = False  # Disable JSearch
-        scraper.openai_client = mock_openai_instance
-        scraper.firecrawl_scraper.firecrawl = mock_firecrawl_instance
-
-        return scraper, mock_firecrawl_instance
-
-    @pytest.mark.asyncio
-    async def test_job_scraper_uses_only_firecrawl(self, scraper_firecrawl_only):
+    async def test_job_scraper_uses_only_firecrawl(self, rig):
         """Test that JobScraper uses ONLY FireCrawl when configured"""
-        scraper, mock_firecrawl = scraper_firecrawl_only
+        scraper = rig.job_scraper
+        mock_firecrawl = rig.mock_firecrawl
 
         # Mock query expansion
         scraper._expand_job_query = Mock(return_value=["Software Engineer"])
 
         # Mock FireCrawl response
-        mock_firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "Software Engineer at Google",
-                    "url": "https://google.com/job1",
-                    "description": "Great job at Google"
-                }
-            ]
-        }
+        mock_firecrawl.search.return_value = mk_response(
+            ("Software Engineer at Google", "https://google.com/job1", "Great job at Google")
+        )
 
         results = await scraper.search(
             job_title="Software Engineer",
@@ -430,10 +290,10 @@ class TestJobScraperWithFireCrawlOnly:
         # Verify FireCrawl was called
         assert mock_firecrawl.search.called
 
-    @pytest.mark.asyncio
-    async def test_job_scraper_firecrawl_only_no_other_sources(self, scraper_firecrawl_only):
+    async def test_job_scraper_firecrawl_only_no_other_sources(self, rig):
         """Verify that no other sources are used when FireCrawl-only is configured"""
-        scraper, mock_firecrawl = scraper_firecrawl_only
+        scraper = rig.job_scraper
+        mock_firecrawl = rig.mock_firecrawl
 
         # Verify configuration
         assert scraper.use_jsearch == False
@@ -442,15 +302,9 @@ class TestJobScraperWithFireCrawlOnly:
 
         # Mock FireCrawl
         scraper._expand_job_query = Mock(return_value=["AI Engineer"])
-        mock_firecrawl.search.return_value = {
-            "data": [
-                {
-                    "title": "AI Engineer at OpenAI",
-                    "url": "https://openai.com/job1",
-                    "description": "AI role"
-                }
-            ]
-        }
+        mock_firecrawl.search.return_value = mk_response(
+            ("AI Engineer at OpenAI", "https://openai.com/job1", "AI role")
+        )
 
         results = await scraper.search(
             job_title="AI Engineer",
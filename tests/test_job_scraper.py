@@ -4,23 +4,17 @@ Tests query expansion, API search, and job deduplication
 """
 
 import pytest
-import os
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import asyncio
 from typing import List
 
-from agents.job_scraper import JobScraper
+from agents.job_scraper import JobScraper, _normalize_query, _normalize_url
 from models.models import Job
 
 
 class TestJobScraperInitialization:
     """Test JobScraper initialization with different configurations"""
 
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key",
-        "JSEARCH_API_KEY": "test_jsearch_key",
-        "BRAVE_SEARCH_API_KEY": "test_brave_key"
-    })
     @patch('agents.job_scraper.OpenAI')
     @patch('agents.brave_search.BraveSearchAgent')
     def test_init_with_all_credentials(self, mock_brave, mock_openai):
@@ -31,59 +25,54 @@ class TestJobScraperInitialization:
         assert scraper.use_jsearch is True
         assert scraper.use_brave_search is True
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_init_without_openai_key_raises_error(self):
+    def test_init_without_openai_key_raises_error(self, monkeypatch):
         """Test that missing OpenAI API key raises ValueError"""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
         with pytest.raises(ValueError) as excinfo:
             JobScraper()
         assert "OPENAI_API_KEY not found" in str(excinfo.value)
 
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key"
-        # No JSEARCH_API_KEY
-    })
     @patch('agents.job_scraper.OpenAI')
     @patch('agents.brave_search.BraveSearchAgent')
-    def test_init_without_jsearch_disables_jsearch(self, mock_brave, mock_openai):
+    def test_init_without_jsearch_disables_jsearch(self, mock_brave, mock_openai, monkeypatch):
         """Test initialization without JSearch disables JSearch"""
+        monkeypatch.delenv("JSEARCH_API_KEY", raising=False)
+
         scraper = JobScraper()
 
         assert scraper.use_jsearch is False
         assert scraper.use_brave_search is True
 
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key",
-        "JSEARCH_API_KEY": "test_jsearch_key"
-        # No BRAVE_SEARCH_API_KEY
-    })
     @patch('agents.job_scraper.OpenAI')
     @patch('agents.brave_search.BraveSearchAgent', side_effect=ValueError("No Brave key"))
-    def test_init_without_brave_disables_brave(self, mock_brave, mock_openai):
+    def test_init_without_brave_disables_brave(self, mock_brave, mock_openai, monkeypatch):
         """Test initialization without Brave Search disables Brave"""
+        monkeypatch.delenv("BRAVE_SEARCH_API_KEY", raising=False)
+
         scraper = JobScraper()
 
         assert scraper.use_jsearch is True
         assert scraper.use_brave_search is False
 
+    @patch('agents.job_scraper.OpenAI')
+    def test_openai_client_shared_between_instances(self, mock_openai):
+        """Test that JobScraper instances reuse a single OpenAI client"""
+        first = JobScraper(use_brave_search=False, use_firecrawl=False)
+        second = JobScraper(use_brave_search=False, use_firecrawl=False)
+
+        assert first.openai_client is second.openai_client
+        mock_openai.assert_called_once_with(api_key="test_openai_key")
+
 
 class TestQueryExpansion:
     """Test smart query expansion using OpenAI"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key",
-        "JSEARCH_API_KEY": "test_jsearch_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave, mock_openai_cls):
+    def scraper(self, job_scraper):
         """Create test scraper"""
-        mock_openai_instance = MagicMock()
-        mock_openai_cls.return_value = mock_openai_instance
-
-        scraper = JobScraper(use_brave_search=False)
-        scraper.openai_client = mock_openai_instance
-        return scraper
+        job_scraper.use_brave_search = False
+        return job_scraper
 
     def test_expand_job_query_success(self, scraper):
         """Test successful query expansion"""
@@ -137,19 +126,76 @@ class TestQueryExpansion:
         assert len(result) == 1
         assert result[0] == "data scientist"
 
+    def test_expand_job_query_uses_cache(self, scraper):
+        """Test that repeated queries are served from the expansion cache"""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '["DevOps Engineer", "Site Reliability Engineer"]'
+
+        scraper.openai_client.chat.completions.create.return_value = mock_response
+
+        first = scraper._expand_job_query("devops")
+        second = scraper._expand_job_query("  DevOps ")
+
+        assert first == second == ["DevOps Engineer", "Site Reliability Engineer"]
+        assert scraper.openai_client.chat.completions.create.call_count == 1
+
+        # Different experience level is a different prompt, so it is not a cache hit
+        scraper._expand_job_query("devops", "Senior")
+        assert scraper.openai_client.chat.completions.create.call_count == 2
+
+    def test_expand_job_query_cache_matches_near_duplicates(self, scraper):
+        """Test that shorthand variants of the same query share one cache entry"""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '["Python Developer", "Python Engineer"]'
+
+        scraper.openai_client.chat.completions.create.return_value = mock_response
+
+        for query in ["python dev", "Python Developer", "py developer", "Python  devs"]:
+            assert scraper._expand_job_query(query) == ["Python Developer", "Python Engineer"]
+
+        assert scraper.openai_client.chat.completions.create.call_count == 1
+
+    @pytest.mark.parametrize("query, expected", [
+        ("Sr. Py Dev", "senior python developer"),
+        ("Be a developer", "be a developer"),
+        ("fe engineer", "fe engineer"),
+        (".NET developer", ".net developer"),
+        ("back-end devs", "backend developer"),
+    ])
+    def test_normalize_query(self, query, expected):
+        """Test that shorthand is expanded without rewriting ordinary words or .NET"""
+        assert _normalize_query(query) == expected
+
+    def test_expand_job_query_system_prompt_is_stable(self, scraper):
+        """Test that every expansion sends the same system message first (prompt-cacheable prefix)"""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '["Data Engineer"]'
+
+        scraper.openai_client.chat.completions.create.return_value = mock_response
+
+        scraper._expand_job_query("data engineer", "Junior")
+        scraper._expand_job_query("frontend", "Senior")
+
+        first, second = (
+            call.kwargs['messages'] for call in scraper.openai_client.chat.completions.create.call_args_list
+        )
+        assert first[0] == second[0]
+        assert first[0]["role"] == "system"
+        assert "frontend" in second[1]["content"]
+
 
 class TestMockJobs:
     """Test mock job generation"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave, mock_openai):
+    def scraper(self, job_scraper):
         """Create test scraper"""
-        return JobScraper(use_brave_search=False)
+        job_scraper.use_jsearch = False
+        job_scraper.use_brave_search = False
+        return job_scraper
 
     def test_get_mock_jobs_returns_jobs(self, scraper):
         """Test that mock jobs are generated correctly"""
@@ -193,24 +239,16 @@ class TestJSearchAPI:
     """Test JSearch API integration"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key",
-        "JSEARCH_API_KEY": "test_jsearch_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave, mock_openai):
+    def scraper(self, job_scraper):
         """Create test scraper with JSearch enabled"""
-        return JobScraper(use_brave_search=False)
+        job_scraper.use_brave_search = False
+        return job_scraper
 
-    @pytest.mark.asyncio
-    @patch('requests.get')
-    async def test_search_jsearch_api_success(self, mock_get, scraper):
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_api_success(self, mock_get, scraper, make_resp):
         """Test successful JSearch API call"""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = make_resp(200, {
             "data": [
                 {
                     "job_title": "Software Engineer",
@@ -223,7 +261,7 @@ class TestJSearchAPI:
                     "job_is_remote": False
                 }
             ]
-        }
+        })
         mock_get.return_value = mock_response
 
         jobs = await scraper._search_jsearch_api("Software Engineer", location="Tel Aviv", num_jobs=5)
@@ -234,26 +272,25 @@ class TestJSearchAPI:
         assert jobs[0].location == "Tel Aviv, Israel"
         assert jobs[0].source == "jsearch"
 
-    @pytest.mark.asyncio
-    @patch('requests.get')
-    async def test_search_jsearch_api_no_results(self, mock_get, scraper):
+        # Only the fields used to build Job objects are requested
+        requested_fields = mock_get.call_args.kwargs['params']['fields'].split(",")
+        assert "job_title" in requested_fields
+        assert "job_description" in requested_fields
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_api_no_results(self, mock_get, scraper, make_resp):
         """Test JSearch API with no results"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
+        mock_response = make_resp(200, {"data": []})
         mock_get.return_value = mock_response
 
         jobs = await scraper._search_jsearch_api("Nonexistent Job", location="Mars", num_jobs=5)
 
         assert len(jobs) == 0
 
-    @pytest.mark.asyncio
-    @patch('requests.get')
-    async def test_search_jsearch_api_error(self, mock_get, scraper):
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_api_error(self, mock_get, scraper, make_resp):
         """Test JSearch API error handling"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        mock_response = make_resp(500, text="Internal Server Error")
         mock_get.return_value = mock_response
 
         with pytest.raises(Exception) as excinfo:
@@ -261,19 +298,14 @@ class TestJSearchAPI:
 
         assert "JSearch API error" in str(excinfo.value)
 
-    @pytest.mark.asyncio
-    @patch('requests.get')
-    async def test_search_jsearch_remote_fallback(self, mock_get, scraper):
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_remote_fallback(self, mock_get, scraper, make_resp):
         """Test fallback to remote search when location search fails"""
         # First call (with location) returns no results
-        mock_response_1 = MagicMock()
-        mock_response_1.status_code = 200
-        mock_response_1.json.return_value = {"data": []}
+        mock_response_1 = make_resp(200, {"data": []})
 
         # Second call (remote) returns results
-        mock_response_2 = MagicMock()
-        mock_response_2.status_code = 200
-        mock_response_2.json.return_value = {
+        mock_response_2 = make_resp(200, {
             "data": [
                 {
                     "job_title": "Remote Developer",
@@ -285,7 +317,7 @@ class TestJSearchAPI:
                     "job_is_remote": True
                 }
             ]
-        }
+        })
 
         mock_get.side_effect = [mock_response_1, mock_response_2]
 
@@ -294,19 +326,66 @@ class TestJSearchAPI:
         assert len(jobs) == 1
         assert jobs[0].location == "Remote"
 
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_cache_hit(self, mock_get, scraper, make_resp):
+        """Test that an identical JSearch search within the TTL is served from cache"""
+        mock_response = make_resp(200, {
+            "data": [
+                {
+                    "job_title": "Software Engineer",
+                    "employer_name": "Tech Company",
+                    "job_description": "Great opportunity",
+                    "job_apply_link": "https://example.com/job1"
+                }
+            ]
+        })
+        mock_get.return_value = mock_response
+
+        first = await scraper._search_jsearch_api("Software Engineer", num_jobs=5)
+        second = await scraper._search_jsearch_api("Software Engineer", num_jobs=5)
+
+        assert mock_get.call_count == 1
+        assert [job.url for job in first] == [job.url for job in second]
+
+        # A different key is a cache miss
+        await scraper._search_jsearch_api("Software Engineer", num_jobs=10)
+        assert mock_get.call_count == 2
+
+    @patch('httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_search_jsearch_batched(self, mock_get, scraper, make_resp):
+        """Test that several expanded titles are searched with a single JSearch request"""
+        mock_response = make_resp(200, {
+            "data": [
+                {
+                    "job_title": "Python Engineer",
+                    "employer_name": "Tech Company",
+                    "job_city": "Tel Aviv",
+                    "job_country": "Israel",
+                    "job_description": "Great opportunity",
+                    "job_apply_link": "https://example.com/job1"
+                }
+            ]
+        })
+        mock_get.return_value = mock_response
+
+        jobs = await scraper._search_jsearch_api_batch(
+            ["Python Developer", "Python Engineer"], location="Tel Aviv", num_jobs=5
+        )
+
+        assert len(jobs) == 1
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs['params']['query'] == '("Python Developer" OR "Python Engineer") in Tel Aviv'
+
 
 class TestConvertToJobs:
     """Test conversion of API responses to Job objects"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave, mock_openai):
+    def scraper(self, job_scraper):
         """Create test scraper"""
-        return JobScraper(use_brave_search=False)
+        job_scraper.use_jsearch = False
+        job_scraper.use_brave_search = False
+        return job_scraper
 
     def test_convert_to_jobs_with_full_data(self, scraper):
         """Test conversion with complete job data"""
@@ -364,26 +443,11 @@ class TestMainSearchMethod:
     """Test the main search method with query expansion and multi-source"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key",
-        "JSEARCH_API_KEY": "test_jsearch_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave_cls, mock_openai_cls):
-        """Create test scraper with mocked APIs"""
-        mock_openai_instance = MagicMock()
-        mock_openai_cls.return_value = mock_openai_instance
+    def scraper(self, job_scraper):
+        """Create test scraper with mocked APIs (JSearch + Brave Search)"""
+        job_scraper.use_brave_search = True
+        return job_scraper
 
-        mock_brave_instance = MagicMock()
-        mock_brave_cls.return_value = mock_brave_instance
-
-        scraper = JobScraper()
-        scraper.openai_client = mock_openai_instance
-        scraper.brave_agent = mock_brave_instance
-        return scraper
-
-    @pytest.mark.asyncio
     async def test_search_full_workflow(self, scraper):
         """Test complete search workflow with query expansion"""
         # Mock query expansion
@@ -411,13 +475,16 @@ class TestMainSearchMethod:
         results = await scraper.search("python dev", location="Tel Aviv", num_jobs=10)
 
         # Verify query expansion was called
-        scraper._expand_job_query.assert_called_once_with("python dev")
+        scraper._expand_job_query.assert_called_once_with("python dev", "Mid")
 
         # Verify results
         assert len(results) > 0
         assert all(isinstance(job, Job) for job in results)
 
-    @pytest.mark.asyncio
+        # All expanded queries go to JSearch in one batched call
+        scraper._search_jsearch_api.assert_awaited_once()
+        assert scraper._search_jsearch_api.call_args.args[0] == '("Python Developer" OR "Python Engineer")'
+
     async def test_search_deduplication(self, scraper):
         """Test that duplicate jobs are removed"""
         scraper._expand_job_query = Mock(return_value=["Developer"])
@@ -437,7 +504,56 @@ class TestMainSearchMethod:
         # Should have only 1 job (duplicate removed)
         assert len(results) == 1
 
-    @pytest.mark.asyncio
+    async def test_search_deduplication_ignores_tracking_params(self, scraper):
+        """Test that URLs differing only by tracking params (utm_*, gclid, ...) / trailing slash are duplicates"""
+        scraper._expand_job_query = Mock(return_value=["Developer"])
+
+        jobs = [
+            Job(title="Backend Developer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://example.com/jobs/1", source="jsearch"),
+            Job(title="Backend Engineer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://Example.com/jobs/1/?utm_source=linkedin#apply", source="jsearch"),
+            Job(title="Frontend Developer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://example.com/jobs/1?id=2&utm_medium=email", source="jsearch"),
+            Job(title="Frontend Engineer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://example.com/jobs/1?gclid=abc&id=2", source="jsearch"),
+        ]
+        scraper._search_jsearch_api = AsyncMock(return_value=jobs)
+        scraper.use_brave_search = False
+
+        results = await scraper.search("developer", num_jobs=10)
+
+        assert [job.title for job in results] == ["Backend Developer", "Frontend Developer"]
+
+    async def test_search_deduplication_keeps_case_sensitive_paths(self, scraper):
+        """Test that URLs differing only in path / query case are distinct postings"""
+        scraper._expand_job_query = Mock(return_value=["Developer"])
+
+        jobs = [
+            Job(title="Backend Developer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://jobs.lever.co/techcorp/aB3xK9", source="jsearch"),
+            Job(title="Backend Engineer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="https://jobs.lever.co/techcorp/Ab3Xk9", source="jsearch"),
+            Job(title="Frontend Developer", company="Tech Corp", location="Tel Aviv",
+                description="Job", url="HTTPS://Jobs.Lever.co/techcorp/aB3xK9?UTM_SOURCE=x", source="jsearch"),
+        ]
+        scraper._search_jsearch_api = AsyncMock(return_value=jobs)
+        scraper.use_brave_search = False
+
+        results = await scraper.search("developer", num_jobs=10)
+
+        assert [job.title for job in results] == ["Backend Developer", "Backend Engineer"]
+
+    @pytest.mark.parametrize("url, expected", [
+        ("HTTPS://Example.com/jobs/1/?utm_source=x&id=2#apply", "https://example.com/jobs/1?id=2"),
+        ("https://example.com/jobs?gclid=abc", "https://example.com/jobs"),
+        ("https://example.com/apply?next=/jobs/", "https://example.com/apply?next=/jobs/"),
+        ("https://example.com/apply?next=/jobs/&utm_medium=email", "https://example.com/apply?next=/jobs/"),
+    ])
+    def test_normalize_url(self, url, expected):
+        """Test that only tracking params, the fragment and the path's trailing slash are dropped"""
+        assert _normalize_url(url) == expected
+
     async def test_search_with_no_sources(self, scraper):
         """Test search when no sources are available"""
         scraper.use_jsearch = False
@@ -448,7 +564,6 @@ class TestMainSearchMethod:
 
         assert len(results) == 0
 
-    @pytest.mark.asyncio
     async def test_search_balances_sources(self, scraper):
         """Test that search balances results from different sources"""
         scraper._expand_job_query = Mock(return_value=["Developer"])
@@ -480,7 +595,6 @@ class TestMainSearchMethod:
         assert brave_count > 0
         assert abs(jsearch_count - brave_count) <= 2  # Allow small difference
 
-    @pytest.mark.asyncio
     async def test_search_handles_api_failures_gracefully(self, scraper):
         """Test that search continues even if one source fails"""
         scraper._expand_job_query = Mock(return_value=["Developer"])
@@ -501,21 +615,41 @@ class TestMainSearchMethod:
         assert len(results) == 1
         assert results[0].source == "brave_search"
 
+    async def test_search_runs_sources_concurrently(self, scraper):
+        """Test that source searches are awaited together, not one after another"""
+        scraper._expand_job_query = Mock(return_value=["Developer"])
+        brave_started = asyncio.Event()
+
+        async def slow_jsearch(query, location, num_jobs):
+            # Only completes once Brave has started, which would deadlock if run sequentially
+            await brave_started.wait()
+            return [Job(title="JSearch Job", company="Company A", location="Tel Aviv",
+                        description="Desc", url="https://example.com/j1", source="jsearch")]
+
+        async def brave_search(query, location, num_jobs):
+            brave_started.set()
+            return [Job(title="Brave Job", company="Company B", location="Tel Aviv",
+                        description="Desc", url="https://example.com/b1", source="brave_search")]
+
+        scraper._search_jsearch_api = slow_jsearch
+        scraper.brave_agent.search_jobs = brave_search
+        scraper.use_brave_search = True
+
+        results = await asyncio.wait_for(scraper.search("developer", num_jobs=10), timeout=1)
+
+        assert {job.source for job in results} == {"jsearch", "brave_search"}
+
 
 class TestEdgeCases:
     """Test edge cases and error scenarios"""
 
     @pytest.fixture
-    @patch.dict(os.environ, {
-        "OPENAI_API_KEY": "test_openai_key"
-    })
-    @patch('agents.job_scraper.OpenAI')
-    @patch('agents.brave_search.BraveSearchAgent')
-    def scraper(self, mock_brave, mock_openai):
+    def scraper(self, job_scraper):
         """Create test scraper"""
-        return JobScraper(use_brave_search=False)
+        job_scraper.use_jsearch = False
+        job_scraper.use_brave_search = False
+        return job_scraper
 
-    @pytest.mark.asyncio
     async def test_search_with_empty_query(self, scraper):
         """Test search with empty query string"""
         scraper._expand_job_query = Mock(return_value=[""])
@@ -525,7 +659,6 @@ class TestEdgeCases:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_search_with_special_characters(self, scraper):
         """Test search with special characters in query"""
         scraper._expand_job_query = Mock(return_value=["C++ Developer"])
@@ -1,31 +1,26 @@
 """
 Quick test to verify JSearch API is working
+
+test_jsearch_live hits the real API and only runs with --run-integration.
+Offline coverage of the JSearch client lives in test_job_scraper.py.
 """
 import os
+
+import pytest
 import requests
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def test_jsearch_api():
-    """Test JSearch API connection"""
-    print("🔍 Testing JSearch API...\n")
-
-    # Get API credentials
-    api_key = os.getenv("JSEARCH_API_KEY")
-    api_host = os.getenv("RAPIDAPI_HOST")
+JSEARCH_URL = "https://jsearch.p.rapidapi.com/search"
 
-    if not api_key:
-        print("❌ JSEARCH_API_KEY not found in .env file!")
-        return False
 
+def _check_jsearch_api(api_key, api_host) -> bool:
+    """Make one JSearch request and print the first job found"""
     print(f"✅ API Key found: {api_key[:20]}...")
     print(f"✅ API Host: {api_host}\n")
 
-    # Make API request
-    url = "https://jsearch.p.rapidapi.com/search"
-
     headers = {
         "X-RapidAPI-Key": api_key,
         "X-RapidAPI-Host": api_host
@@ -42,7 +37,7 @@ def test_jsearch_api():
     print(f"   Query: {params['query']}\n")
 
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = requests.get(JSEARCH_URL, headers=headers, params=params)
 
         print(f"📊 Status Code: {response.status_code}")
 
@@ -71,8 +66,31 @@ def test_jsearch_api():
         print(f"❌ Exception: {e}")
         return False
 
+
+@pytest.mark.integration
+def test_jsearch_live(live_env):
+    """Test JSearch API connection (real HTTPS call, uses API credits)"""
+    print("🔍 Testing JSearch API...\n")
+
+    # Get API credentials
+    api_key = os.getenv("JSEARCH_API_KEY")
+    api_host = os.getenv("RAPIDAPI_HOST")
+
+    if not api_key:
+        pytest.skip("JSEARCH_API_KEY not found in .env file")
+
+    assert _check_jsearch_api(api_key, api_host)
+
+
 if __name__ == "__main__":
-    success = test_jsearch_api()
+    api_key = os.getenv("JSEARCH_API_KEY")
+
+    if not api_key:
+        print("❌ JSEARCH_API_KEY not found in .env file!")
+        success = False
+    else:
+        print("🔍 Testing JSearch API...\n")
+        success = _check_jsearch_api(api_key, os.getenv("RAPIDAPI_HOST"))
 
     if success:
         print("\n" + "="*50)
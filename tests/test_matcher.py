@@ -4,124 +4,123 @@ Comprehensive tests for Agent 4: Smart Matcher
 
 import pytest
 import asyncio
+import hashlib
+import os
+from types import SimpleNamespace
+import numpy as np
 from unittest.mock import Mock, MagicMock, patch
-from agents.matcher import SmartMatcher
+from agents import matcher as matcher_module
+from agents.matcher import SmartMatcher, _unit, _quantize, _dequantize
 from models.models import CVAnalysis, Job, CompanyInsights, JobMatch
 
 
 class TestCosineSimiliarity:
     """Test the cosine similarity calculation"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
+    @pytest.mark.parametrize("vec1, vec2, expected", [
+        ([1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0], 1.0),   # identical
+        ([1.0, 2.0, 3.0], [-1.0, -2.0, -3.0], -1.0),         # opposite
+        ([1.0, 0.0], [0.0, 1.0], 0.0),                       # orthogonal
+        ([0.0, 0.0, 0.0], [1.0, 2.0, 3.0], 0.0),             # zero vector (no division by zero)
+        ([0.0, 0.0], [0.0, 0.0], 0.0),                       # both zero
+    ], ids=["identical", "opposite", "orthogonal", "zero_vector", "both_zero"])
+    def test_cosine(self, matcher, vec1, vec2, expected):
+        """Test cosine similarity on vectors with a known exact answer"""
+        similarity = matcher._cosine_similarity(vec1, vec2)
 
-    def test_identical_vectors(self):
-        """Test that identical vectors have similarity of 1.0"""
-        vec1 = [1.0, 2.0, 3.0, 4.0]
-        vec2 = [1.0, 2.0, 3.0, 4.0]
+        assert similarity == pytest.approx(expected, abs=0.001)
 
-        similarity = self.matcher._cosine_similarity(vec1, vec2)
-
-        assert similarity == pytest.approx(1.0, abs=0.001)
-
-    def test_opposite_vectors(self):
-        """Test that opposite vectors have similarity of -1.0"""
+    def test_similar_vectors(self, matcher):
+        """Test similar (but not identical) vectors"""
         vec1 = [1.0, 2.0, 3.0]
-        vec2 = [-1.0, -2.0, -3.0]
-
-        similarity = self.matcher._cosine_similarity(vec1, vec2)
-
-        assert similarity == pytest.approx(-1.0, abs=0.001)
-
-    def test_orthogonal_vectors(self):
-        """Test that perpendicular vectors have similarity of 0.0"""
-        vec1 = [1.0, 0.0]
-        vec2 = [0.0, 1.0]
+        vec2 = [1.1, 2.1, 2.9]
 
-        similarity = self.matcher._cosine_similarity(vec1, vec2)
+        similarity = matcher._cosine_similarity(vec1, vec2)
 
-        assert similarity == pytest.approx(0.0, abs=0.001)
+        # Should be close to 1.0 but not exactly
+        assert 0.95 < similarity < 1.0
 
-    def test_zero_vector(self):
-        """Test that zero vectors return 0.0 (avoid division by zero)"""
-        vec1 = [0.0, 0.0, 0.0]
-        vec2 = [1.0, 2.0, 3.0]
+    def test_normalized_matches_general(self, matcher):
+        """Test that the unit-vector fast path agrees with the general formula"""
+        vec1 = [1.0, 2.0, 3.0]
+        vec2 = [1.1, 2.1, 2.9]
 
-        similarity = self.matcher._cosine_similarity(vec1, vec2)
+        fast = matcher._cosine_similarity_normalized(_unit(vec1), _unit(vec2))
 
-        assert similarity == 0.0
+        assert fast == pytest.approx(matcher._cosine_similarity(vec1, vec2), abs=0.001)
+        assert not _unit([0.0, 0.0, 0.0]).any()
 
-    def test_similar_vectors(self):
-        """Test similar (but not identical) vectors"""
-        vec1 = [1.0, 2.0, 3.0]
-        vec2 = [1.1, 2.1, 2.9]
+    def test_int8_quantization_preserves_similarity(self, matcher):
+        """Test that int8-quantized (cached) embeddings keep cosine similarity within 1e-2"""
+        rng = np.random.default_rng(0)
+        vec1, vec2 = rng.normal(size=(2, 1536))
 
-        similarity = self.matcher._cosine_similarity(vec1, vec2)
+        exact = matcher._cosine_similarity(vec1, vec2)
+        quantized = matcher._cosine_similarity(_dequantize(*_quantize(vec1)), _dequantize(*_quantize(vec2)))
 
-        # Should be close to 1.0 but not exactly
-        assert 0.95 < similarity < 1.0
+        assert quantized == pytest.approx(exact, abs=0.01)
 
 
 class TestSkillOverlap:
     """Test skill overlap calculation"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
-
-    def test_perfect_overlap(self):
+    def test_perfect_overlap(self, matcher):
         """Test when all CV skills are in job description"""
         cv_skills = ["Python", "Docker", "PostgreSQL"]
         job_desc = "We need a developer with Python, Docker, and PostgreSQL experience"
 
-        overlap, missing = self.matcher._calculate_skill_overlap(cv_skills, job_desc)
+        overlap, missing = matcher._calculate_skill_overlap(cv_skills, job_desc)
 
         assert len(overlap) == 3
         assert "Python" in overlap
         assert "Docker" in overlap
         assert "PostgreSQL" in overlap
 
-    def test_partial_overlap(self):
+    def test_partial_overlap(self, matcher):
         """Test when only some CV skills match"""
         cv_skills = ["Python", "Java", "Ruby"]
         job_desc = "Looking for Python and JavaScript developer"
 
-        overlap, missing = self.matcher._calculate_skill_overlap(cv_skills, job_desc)
+        overlap, missing = matcher._calculate_skill_overlap(cv_skills, job_desc)
 
         assert "Python" in overlap
         assert "Java" not in overlap
         assert "JavaScript" in missing
 
-    def test_no_overlap(self):
+    def test_no_overlap(self, matcher):
         """Test when no CV skills match"""
         cv_skills = ["Python", "Django"]
         job_desc = "Looking for Java and Spring Boot developer"
 
-        overlap, missing = self.matcher._calculate_skill_overlap(cv_skills, job_desc)
+        overlap, missing = matcher._calculate_skill_overlap(cv_skills, job_desc)
 
         assert len(overlap) == 0
         assert "Java" in missing
 
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, matcher):
         """Test that skill matching is case-insensitive"""
         cv_skills = ["Python", "DOCKER"]
         job_desc = "Experience with python and docker required"
 
-        overlap, missing = self.matcher._calculate_skill_overlap(cv_skills, job_desc)
+        overlap, missing = matcher._calculate_skill_overlap(cv_skills, job_desc)
 
         assert len(overlap) == 2
 
+    def test_missing_skills_ignore_case(self, matcher):
+        """Test that a CV skill in different case is not reported as missing"""
+        cv_skills = ["python", "KUBERNETES"]
+        job_desc = "Python and Kubernetes, plus Terraform"
+
+        overlap, missing = matcher._calculate_skill_overlap(cv_skills, job_desc)
+
+        assert missing == ["Terraform"]
+
 
 class TestBatchEmbeddings:
     """Test batch embeddings functionality"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
-
     @patch('agents.matcher.SmartMatcher._create_embeddings_batch')
-    def test_batch_embeddings_called_once(self, mock_batch):
+    def test_batch_embeddings_called_once(self, mock_batch, matcher):
         """Test that batch embeddings is called once for all jobs"""
         # Setup mock return value
         mock_batch.return_value = [
@@ -131,15 +130,15 @@ class TestBatchEmbeddings:
         ]
 
         texts = ["Job 1 description", "Job 2 description", "Job 3 description"]
-        embeddings = self.matcher._create_embeddings_batch(texts)
+        embeddings = matcher._create_embeddings_batch(texts)
 
         # Should be called once
         mock_batch.assert_called_once()
         assert len(embeddings) == 3
 
-    def test_batch_embeddings_returns_correct_count(self):
+    def test_batch_embeddings_returns_correct_count(self, matcher):
         """Test that batch returns same number of embeddings as inputs"""
-        with patch.object(self.matcher.client.embeddings, 'create') as mock_create:
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
             # Mock OpenAI response
             mock_response = MagicMock()
             mock_response.data = [
@@ -150,7 +149,7 @@ class TestBatchEmbeddings:
             mock_create.return_value = mock_response
 
             texts = ["Text 1", "Text 2", "Text 3"]
-            embeddings = self.matcher._create_embeddings_batch(texts)
+            embeddings = matcher._create_embeddings_batch(texts)
 
             assert len(embeddings) == 3
             assert len(embeddings[0]) == 2
@@ -158,24 +157,24 @@ class TestBatchEmbeddings:
             assert embeddings[1] == [0.3, 0.4]
             assert embeddings[2] == [0.5, 0.6]
 
-    def test_batch_embeddings_cleans_text(self):
+    def test_batch_embeddings_cleans_text(self, matcher):
         """Test that batch embeddings cleans text properly"""
-        with patch.object(self.matcher.client.embeddings, 'create') as mock_create:
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
             mock_response = MagicMock()
             mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
             mock_create.return_value = mock_response
 
             # Text with extra whitespace
             texts = ["Text   with    lots    of    spaces"]
-            self.matcher._create_embeddings_batch(texts)
+            matcher._create_embeddings_batch(texts)
 
             # Check that the text was cleaned before being sent
             called_with = mock_create.call_args[1]['input']
             assert "   " not in called_with[0]  # No triple spaces
 
-    def test_batch_embeddings_truncates_long_text(self):
+    def test_batch_embeddings_truncates_long_text(self, matcher):
         """Test that batch embeddings truncates very long text"""
-        with patch.object(self.matcher.client.embeddings, 'create') as mock_create:
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
             mock_response = MagicMock()
             mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
             mock_create.return_value = mock_response
@@ -183,15 +182,15 @@ class TestBatchEmbeddings:
             # Create text longer than 8000 chars
             long_text = "x" * 10000
             texts = [long_text]
-            self.matcher._create_embeddings_batch(texts)
+            matcher._create_embeddings_batch(texts)
 
             # Check that text was truncated
             called_with = mock_create.call_args[1]['input']
             assert len(called_with[0]) <= 8000
 
-    def test_batch_embeddings_efficiency(self):
+    def test_batch_embeddings_efficiency(self, matcher):
         """Test that batch is more efficient than individual calls"""
-        with patch.object(self.matcher.client.embeddings, 'create') as mock_create:
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
             mock_response = MagicMock()
             mock_response.data = [
                 MagicMock(embedding=[0.1, 0.2]),
@@ -204,20 +203,90 @@ class TestBatchEmbeddings:
 
             # Batch processing 5 texts
             texts = [f"Text {i}" for i in range(5)]
-            self.matcher._create_embeddings_batch(texts)
+            matcher._create_embeddings_batch(texts)
 
             # Should be called only ONCE for all 5 texts!
             assert mock_create.call_count == 1
 
+    def test_batch_embeddings_cached(self, matcher):
+        """Test that identical texts are not re-embedded, and only misses are sent"""
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2]), MagicMock(embedding=[0.3, 0.4])]
+            mock_create.return_value = mock_response
+
+            texts = ["Job 1 description", "Job 2 description"]
+            first = matcher._create_embeddings_batch(texts)
+            second = matcher._create_embeddings_batch(texts)
+
+            assert mock_create.call_count == 1
+            assert first == [[0.1, 0.2], [0.3, 0.4]]
+            # Cache hits come back dequantized from int8
+            assert np.allclose(second, first, atol=0.002)
+
+            mock_response.data = [MagicMock(embedding=[0.5, 0.6])]
+            third = matcher._create_embeddings_batch(["Job   2 description", "Job 3 description"])
+
+            assert mock_create.call_args[1]['input'] == ["Job 3 description"]
+            assert np.allclose(third, [[0.3, 0.4], [0.5, 0.6]], atol=0.002)
+
+    def test_batch_embeddings_disk_cache(self, tmp_path, monkeypatch, matcher):
+        """Test that embeddings persisted under EMBEDDING_CACHE_DIR survive the in-memory cache"""
+        monkeypatch.setattr(matcher_module, "_EMBEDDING_CACHE_DIR", str(tmp_path))
+
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
+            mock_create.return_value = mock_response
+
+            matcher._create_embeddings_batch(["Job description"])
+            matcher_module._embedding_cache.clear()
+            embeddings = matcher._create_embeddings_batch(["Job description"])
+
+            assert mock_create.call_count == 1
+            assert np.allclose(embeddings, [[0.1, 0.2]], atol=0.002)
+            assert len(list(tmp_path.rglob("*.npz"))) == 1
+
+    def test_batch_embeddings_corrupt_disk_cache(self, tmp_path, monkeypatch, matcher):
+        """Test that a truncated .npz on disk is treated as a cache miss and rewritten"""
+        monkeypatch.setattr(matcher_module, "_EMBEDDING_CACHE_DIR", str(tmp_path))
+
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
+            mock_create.return_value = mock_response
+
+            matcher._create_embeddings_batch(["Job description"])
+            matcher_module._embedding_cache.clear()
+            (cached_file,) = tmp_path.rglob("*.npz")
+            cached_file.write_bytes(cached_file.read_bytes()[:20])
+
+            embeddings = matcher._create_embeddings_batch(["Job description"])
+
+            assert mock_create.call_count == 2
+            assert np.allclose(embeddings, [[0.1, 0.2]], atol=0.002)
+            assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_batch_embeddings_failed_disk_write_cleans_up(self, tmp_path, monkeypatch, matcher):
+        """Test that a failed cache write (e.g. disk full) leaves no orphan .tmp file"""
+        monkeypatch.setattr(matcher_module, "_EMBEDDING_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(matcher_module.np, "savez", Mock(side_effect=OSError("No space left on device")))
+
+        with patch.object(matcher.client.embeddings, 'create') as mock_create:
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
+            mock_create.return_value = mock_response
+
+            embeddings = matcher._create_embeddings_batch(["Job description"])
+
+        assert np.allclose(embeddings, [[0.1, 0.2]], atol=0.002)
+        assert list(tmp_path.rglob("*")) == [tmp_path / matcher.embedding_model]
+
 
 class TestBaseScore:
     """Test base score calculation"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
-
-    def test_perfect_match(self):
+    def test_perfect_match(self, matcher):
         """Test scoring with perfect similarity and skill overlap"""
         # Create identical embeddings (similarity = 1.0)
         cv_embedding = [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -226,14 +295,14 @@ class TestBaseScore:
         cv_skills = ["Python", "Docker"]
         job_desc = "Python and Docker expert needed"
 
-        score = self.matcher._calculate_base_score(
+        score = matcher._calculate_base_score(
             cv_embedding, job_embedding, cv_skills, job_desc
         )
 
         # Should be high (close to 100)
         assert score > 80
 
-    def test_low_similarity(self):
+    def test_low_similarity(self, matcher):
         """Test scoring with low similarity"""
         # Create very different embeddings
         cv_embedding = [1.0, 0.0, 0.0]
@@ -242,14 +311,14 @@ class TestBaseScore:
         cv_skills = ["Python"]
         job_desc = "Python developer"
 
-        score = self.matcher._calculate_base_score(
+        score = matcher._calculate_base_score(
             cv_embedding, job_embedding, cv_skills, job_desc
         )
 
         # Should be low
         assert score < 50
 
-    def test_score_range(self):
+    def test_score_range(self, matcher):
         """Test that score is always between 0-100"""
         cv_embedding = [1.0, 2.0, 3.0]
         job_embedding = [-1.0, -2.0, -3.0]
@@ -257,7 +326,7 @@ class TestBaseScore:
         cv_skills = ["Python"]
         job_desc = "Java developer"
 
-        score = self.matcher._calculate_base_score(
+        score = matcher._calculate_base_score(
             cv_embedding, job_embedding, cv_skills, job_desc
         )
 
@@ -267,48 +336,28 @@ class TestBaseScore:
 class TestInsightsBonus:
     """Test company insights bonus/penalty"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
-
-    def test_positive_sentiment_bonus(self):
-        """Test that positive sentiment adds bonus"""
+    @pytest.mark.parametrize("sentiment, direction", [
+        ("positive", 1),
+        ("negative", -1),
+        ("neutral", 0),
+    ])
+    def test_sentiment_adjustment(self, matcher, sentiment, direction):
+        """Test that positive sentiment adds a bonus, negative a penalty, neutral ~no change"""
         base_score = 50.0
         insights = CompanyInsights(
             company_name="TestCorp",
-            reddit_sentiment="positive"
+            reddit_sentiment=sentiment
         )
 
-        adjusted_score = self.matcher._apply_insights_bonus(base_score, insights)
+        adjusted_score = matcher._apply_insights_bonus(base_score, insights)
 
-        assert adjusted_score > base_score
+        if direction == 0:
+            # Should be same or very close
+            assert abs(adjusted_score - base_score) < 1
+        else:
+            assert (adjusted_score - base_score) * direction > 0
 
-    def test_negative_sentiment_penalty(self):
-        """Test that negative sentiment reduces score"""
-        base_score = 50.0
-        insights = CompanyInsights(
-            company_name="TestCorp",
-            reddit_sentiment="negative"
-        )
-
-        adjusted_score = self.matcher._apply_insights_bonus(base_score, insights)
-
-        assert adjusted_score < base_score
-
-    def test_neutral_sentiment_no_change(self):
-        """Test that neutral sentiment doesn't change score much"""
-        base_score = 50.0
-        insights = CompanyInsights(
-            company_name="TestCorp",
-            reddit_sentiment="neutral"
-        )
-
-        adjusted_score = self.matcher._apply_insights_bonus(base_score, insights)
-
-        # Should be same or very close
-        assert abs(adjusted_score - base_score) < 1
-
-    def test_score_stays_in_bounds(self):
+    def test_score_stays_in_bounds(self, matcher):
         """Test that adjusted score stays within 0-100"""
         # Test with very high base score
         insights_positive = CompanyInsights(
@@ -316,7 +365,7 @@ class TestInsightsBonus:
             reddit_sentiment="positive"
         )
 
-        score = self.matcher._apply_insights_bonus(98.0, insights_positive)
+        score = matcher._apply_insights_bonus(98.0, insights_positive)
         assert score <= 100
 
         # Test with very low base score
@@ -325,45 +374,64 @@ class TestInsightsBonus:
             reddit_sentiment="negative"
         )
 
-        score = self.matcher._apply_insights_bonus(5.0, insights_negative)
+        score = matcher._apply_insights_bonus(5.0, insights_negative)
         assert score >= 0
 
 
 class TestRecommendation:
     """Test recommendation generation"""
 
-    def setup_method(self):
-        """Initialize matcher for each test"""
-        self.matcher = SmartMatcher()
-
-    def test_strong_match(self):
-        """Test that high scores get 'Strong Match'"""
-        recommendation = self.matcher._generate_recommendation(85.0)
-        assert recommendation == "Strong Match"
-
-    def test_good_fit(self):
-        """Test scores 65-79 get 'Good Fit'"""
-        recommendation = self.matcher._generate_recommendation(70.0)
-        assert recommendation == "Good Fit"
-
-    def test_consider(self):
-        """Test scores 50-64 get 'Consider'"""
-        recommendation = self.matcher._generate_recommendation(55.0)
-        assert recommendation == "Consider"
-
-    def test_skip(self):
-        """Test low scores get 'Skip'"""
-        recommendation = self.matcher._generate_recommendation(30.0)
-        assert recommendation == "Skip"
+    @pytest.mark.parametrize("score, expected", [
+        (85.0, "Strong Match"),
+        (80.0, "Strong Match"),
+        (70.0, "Good Fit"),
+        (65.0, "Good Fit"),
+        (55.0, "Consider"),
+        (50.0, "Consider"),
+        (49.9, "Skip"),
+        (30.0, "Skip"),
+    ])
+    def test_recommendation(self, matcher, score, expected):
+        """Test score -> recommendation bands (>=80 Strong Match, >=65 Good Fit, >=50 Consider)"""
+        assert matcher._generate_recommendation(score) == expected
+
+
+def _fake_embeddings_create(input, model, **kwargs):
+    """Stand-in for client.embeddings.create: a deterministic vector per text (seeded by its hash)"""
+    texts = [input] if isinstance(input, str) else input
+    return SimpleNamespace(data=[
+        SimpleNamespace(embedding=np.random.default_rng(
+            int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        ).normal(size=256).tolist())
+        for text in texts
+    ])
+
+
+@pytest.fixture(params=["fake", pytest.param("live", marks=pytest.mark.integration)])
+def full_matcher(request, matcher):
+    """
+    SmartMatcher for the full pipeline tests
+
+    "fake" (default): the shared matcher with deterministic offline embeddings.
+    "live" (--run-integration): a real SmartMatcher calling the OpenAI embeddings API.
+    """
+    if request.param == "live":
+        request.getfixturevalue("live_env")
+        if not os.getenv("OPENAI_API_KEY"):
+            pytest.skip("OPENAI_API_KEY not found in .env file")
+        yield SmartMatcher()
+        return
+
+    with patch.object(matcher.client.embeddings, 'create', side_effect=_fake_embeddings_create):
+        yield matcher
 
 
 class TestFullMatching:
-    """Integration tests for full matching pipeline"""
+    """Tests for the full matching pipeline (fake embeddings; real ones with --run-integration)"""
 
-    @pytest.mark.asyncio
-    async def test_match_and_rank(self):
+    async def test_match_and_rank(self, full_matcher):
         """Test the full match_and_rank pipeline"""
-        matcher = SmartMatcher()
+        matcher = full_matcher
 
         # Create sample CV
         cv = CVAnalysis(
@@ -417,10 +485,9 @@ class TestFullMatching:
             assert match.recommendation in ["Strong Match", "Good Fit", "Consider", "Skip"]
             assert len(match.reasoning) > 0
 
-    @pytest.mark.asyncio
-    async def test_empty_jobs_list(self):
+    async def test_empty_jobs_list(self, full_matcher):
         """Test behavior with empty jobs list"""
-        matcher = SmartMatcher()
+        matcher = full_matcher
 
         cv = CVAnalysis(
             skills=["Python"],
@@ -432,10 +499,9 @@ class TestFullMatching:
 
         assert matches == []
 
-    @pytest.mark.asyncio
-    async def test_matches_are_sorted(self):
+    async def test_matches_are_sorted(self, full_matcher):
         """Test that matches are sorted by score (highest first)"""
-        matcher = SmartMatcher()
+        matcher = full_matcher
 
         cv = CVAnalysis(
             skills=["Python", "JavaScript", "React"],
@@ -480,6 +546,22 @@ class TestFullMatching:
             assert matches[i].match_score >= matches[i + 1].match_score
 
 
+    async def test_cv_embedding_reused(self, matcher):
+        """Test that matching the same CV again only embeds the new jobs"""
+        cv = CVAnalysis(skills=["Python"], experience_level="Mid", years_of_experience=3)
+        python_job = Job(title="Python Developer", company="TechCorp", location="Remote",
+                         description="Python services", url="https://example.com/job1")
+        go_job = Job(title="Go Developer", company="GoCorp", location="Remote",
+                     description="Go and Kubernetes", url="https://example.com/job2")
+
+        with patch.object(matcher.client.embeddings, 'create', side_effect=_fake_embeddings_create) as mock_create:
+            await matcher.match_and_rank(cv, [python_job], [])
+            await matcher.match_and_rank(cv, [python_job, go_job], [])
+
+        assert mock_create.call_count == 2
+        assert mock_create.call_args[1]['input'] == ["Go Developer Go and Kubernetes"]
+
+
 # Run tests with: pytest tests/test_matcher.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -1,85 +1,109 @@
 """
-Quick test to verify all models work correctly
+Unit tests for the Pydantic data models
+
+The tests share no mutable state (the session fixtures are validated models that
+no test modifies), so xdist can split them per function:
+    python -m pytest tests/test_models.py -n 4
+On its own the module is faster serially; -n pays off with the full suite.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from models.models import CVAnalysis, Job, CompanyInsights, JobMatch
 
+pytestmark = pytest.mark.fast
+
+# Valid model data, built once and passed to the model constructors
+_CV_KWARGS = {
+    "skills": ["Python", "FastAPI", "Docker"],
+    "experience_level": "Mid",
+    "years_of_experience": 3,
+    "preferred_locations": ["Tel Aviv", "Remote"],
+    "key_achievements": ["Built microservices"]
+}
+
+_JOB_KWARGS = {
+    "title": "Python Developer",
+    "company": "TechCorp",
+    "location": "Tel Aviv",
+    "description": "Looking for a Python developer",
+    "url": "https://example.com/job",
+    "posted_date": "2025-10-20",
+    "source": "linkedin"
+}
+
+_INSIGHTS_KWARGS = {
+    "company_name": "TechCorp",
+    "reddit_sentiment": "positive",
+    "reddit_highlights": ["Great culture", "Good WLB"],
+    "recent_news": ["Raised Series B", "Launched new product"],
+    "culture_notes": ["Flexible hours"],
+    "data_source": "reddit+news"
+}
+
+# Invalid payloads, built once and validated with model_validate
+_INVALID_LEVEL_CV_PAYLOAD = {
+    "skills": ["Python"],
+    "experience_level": "Expert",  # ❌ Not in Literal!
+    "years_of_experience": 3
+}
+
+_INVALID_SCORE_MATCH_PAYLOAD = {
+    "match_score": 150  # ❌ Greater than 100!
+}
+
+
+@pytest.fixture(scope="session")
+def sample_job():
+    """Validated Job shared by the tests that nest one in a JobMatch"""
+    return Job(
+        title="Python Developer",
+        company="TechCorp",
+        location="Tel Aviv",
+        description="Looking for Python developer",
+        url="https://example.com/job"
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_insights():
+    """Validated CompanyInsights shared by the tests that nest one in a JobMatch"""
+    return CompanyInsights(
+        company_name="TechCorp",
+        reddit_sentiment="positive"
+    )
+
 
 def test_cv_analysis():
     """Test CVAnalysis model"""
-    print("Testing CVAnalysis...")
-
-    cv = CVAnalysis(
-        skills=["Python", "FastAPI", "Docker"],
-        experience_level="Mid",
-        years_of_experience=3,
-        preferred_locations=["Tel Aviv", "Remote"],
-        key_achievements=["Built microservices"]
-    )
+    cv = CVAnalysis(**_CV_KWARGS)
 
-    print(f"  ✅ CVAnalysis created: {cv.experience_level}, {len(cv.skills)} skills")
     assert cv.years_of_experience == 3
     assert cv.experience_level == "Mid"
 
 
 def test_job():
     """Test Job model"""
-    print("Testing Job...")
+    job = Job(**_JOB_KWARGS)
 
-    job = Job(
-        title="Python Developer",
-        company="TechCorp",
-        location="Tel Aviv",
-        description="Looking for a Python developer",
-        url="https://example.com/job",
-        posted_date="2025-10-20",
-        source="linkedin"
-    )
-
-    print(f"  ✅ Job created: {job.title} at {job.company}")
     assert job.source == "linkedin"
 
 
 def test_company_insights():
     """Test CompanyInsights model"""
-    print("Testing CompanyInsights...")
+    insights = CompanyInsights(**_INSIGHTS_KWARGS)
 
-    insights = CompanyInsights(
-        company_name="TechCorp",
-        reddit_sentiment="positive",
-        reddit_highlights=["Great culture", "Good WLB"],
-        recent_news=["Raised Series B", "Launched new product"],
-        culture_notes=["Flexible hours"],
-        data_source="reddit+news"
-    )
-
-    print(f"  ✅ CompanyInsights created: {insights.company_name}, sentiment={insights.reddit_sentiment}")
     assert insights.reddit_sentiment == "positive"
     assert len(insights.reddit_highlights) == 2
 
 
-def test_job_match():
+def test_job_match(sample_job, sample_insights):
     """Test JobMatch model (uses other models!)"""
-    print("Testing JobMatch...")
-
-    # Create sub-models first
-    job = Job(
-        title="Python Developer",
-        company="TechCorp",
-        location="Tel Aviv",
-        description="Looking for Python developer",
-        url="https://example.com/job"
-    )
-
-    insights = CompanyInsights(
-        company_name="TechCorp",
-        reddit_sentiment="positive"
-    )
-
     # Create JobMatch
     match = JobMatch(
-        job=job,
-        company_insights=insights,
+        job=sample_job,
+        company_insights=sample_insights,
         match_score=85.5,
         skill_overlap=["Python", "FastAPI"],
         skill_gaps=["Kubernetes"],
@@ -87,54 +111,23 @@ def test_job_match():
         reasoning=["Strong skill match", "Positive company culture"]
     )
 
-    print(f"  ✅ JobMatch created: {match.match_score}/100, {match.recommendation}")
     assert match.match_score == 85.5
     assert match.recommendation == "Strong Match"
     assert match.job.company == "TechCorp"
 
 
-def test_validation():
-    """Test that validation works"""
-    print("Testing validation...")
-
-    try:
-        # This should FAIL - invalid experience_level
-        cv = CVAnalysis(
-            skills=["Python"],
-            experience_level="Expert",  # ❌ Not in Literal!
-            years_of_experience=3
-        )
-        print("  ❌ Validation failed - should have caught invalid experience_level")
-    except Exception as e:
-        print(f"  ✅ Validation caught error: {type(e).__name__}")
-
-    try:
-        # This should FAIL - score > 100
-        match = JobMatch(
-            job=Job(title="Test", company="Test", location="Test", description="Test", url="http://test.com"),
-            company_insights=CompanyInsights(company_name="Test"),
-            match_score=150  # ❌ Greater than 100!
-        )
-        print("  ❌ Validation failed - should have caught score > 100")
-    except Exception as e:
-        print(f"  ✅ Validation caught error: {type(e).__name__}")
-
-
-def main():
-    print("🧪 Testing all Pydantic models\n")
-    print("=" * 60)
-
-    test_cv_analysis()
-    test_job()
-    test_company_insights()
-    test_job_match()
-    test_validation()
-
-    print("=" * 60)
-    print("\n🎉 ALL MODEL TESTS PASSED!")
-    print("\n✅ models.py is working correctly!")
-    print("\n📚 Next: Implement Agent 1 (CV Analyzer)")
+def test_invalid_experience_level():
+    """Test that an experience_level outside the Literal is rejected"""
+    with pytest.raises(ValidationError):
+        CVAnalysis.model_validate(_INVALID_LEVEL_CV_PAYLOAD)
+
+
+def test_invalid_match_score(sample_job, sample_insights):
+    """Test that a match_score above 100 is rejected"""
+    payload = {"job": sample_job, "company_insights": sample_insights, **_INVALID_SCORE_MATCH_PAYLOAD}
+    with pytest.raises(ValidationError):
+        JobMatch.model_validate(payload)
 
 
 if __name__ == "__main__":
-    main()
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -1,38 +1,96 @@
 """
-Test Reddit API integration
+Test company research against the live FireCrawl API
+
+test_reddit runs once per company (so pytest -n auto spreads companies across
+workers) and only with --run-integration. Run as a script to fetch all
+companies concurrently and print a report.
 """
 import asyncio
-from agents.news_agent import NewsAgent
+import os
+import sys
+from io import StringIO
+from itertools import islice
+from textwrap import shorten
 
+import pytest
 
-async def test_reddit():
-    print("🧪 Testing Reddit API Integration\n")
-    print("=" * 80)
+from agents.news_agent import NewsAgent, _UNCACHED_SOURCES
+
+# Well-known tech companies to research
+COMPANIES = ["Google", "Microsoft"]
+
+# Cap on concurrent get_insights calls, so a long company list doesn't fire every
+# FireCrawl search at once (each company runs 3 searches)
+MAX_CONCURRENT_COMPANIES = 8
+
+# Report separators
+SEP = "=" * 80
+SUB = "-" * 80
+
+
+def _format_report(company, insights) -> str:
+    """Render the results (or the error) for one company as a printable block"""
+    buf = StringIO()
+    buf.write(f"\n🔍 Testing with: {company}\n")
+    buf.write(f"{SUB}\n")
+
+    if isinstance(insights, Exception):
+        buf.write(f"❌ Failed: {insights}\n")
+    else:
+        buf.write(f"\n📊 Results:\n")
+        buf.write(f"   Company: {insights.company_name}\n")
+        buf.write(f"   Sentiment: {insights.reddit_sentiment}\n")
+        buf.write(f"   Data Source: {insights.data_source}\n")
+        buf.write(f"\n   💬 Highlights ({len(insights.reddit_highlights)}):\n")
+        for i, highlight in enumerate(islice(insights.reddit_highlights, 3), 1):
+            buf.write(f"      {i}. {shorten(highlight, width=103, placeholder='...')}\n")
 
-    # Create agent with Reddit API (not mock!)
-    agent = NewsAgent(use_mock=False)
+    buf.write(f"\n{SEP}\n")
+    return buf.getvalue()
 
-    # Test with a well-known tech company
-    companies = ["Google", "Microsoft"]
 
-    for company in companies:
-        print(f"\n🔍 Testing with: {company}")
-        print("-" * 80)
+@pytest.fixture(scope="session")
+def live_news_agent():
+    """NewsAgent built once per session (per xdist worker) with the real FireCrawl key"""
+    if not os.getenv("FIRECRAWL_API_KEY"):
+        pytest.skip("FIRECRAWL_API_KEY not found in .env file")
+    return NewsAgent()
 
-        insights = await agent.get_insights(company)
 
-        print(f"\n📊 Results:")
-        print(f"   Company: {insights.company_name}")
-        print(f"   Sentiment: {insights.reddit_sentiment}")
-        print(f"   Data Source: {insights.data_source}")
-        print(f"\n   💬 Highlights ({len(insights.reddit_highlights)}):")
-        for i, highlight in enumerate(insights.reddit_highlights[:3], 1):
-            print(f"      {i}. {highlight[:100]}...")
+@pytest.mark.integration
+@pytest.mark.parametrize("company", COMPANIES)
+async def test_reddit(live_news_agent, company):
+    """Test researching one company (real FireCrawl searches, uses API credits)"""
+    insights = await live_news_agent.get_insights(company)
+    sys.stdout.write(_format_report(company, insights))
 
-        print("\n" + "=" * 80)
+    assert insights.company_name == company
+    # Timeout / error / every-search-failed fallbacks
+    assert insights.data_source not in _UNCACHED_SOURCES
+
+
+async def main():
+    print("🧪 Testing Reddit API Integration\n")
+    print(SEP)
+
+    agent = NewsAgent()
+
+    # Fetch all companies concurrently (bounded) in one call
+    results = await agent.get_insights_batch(COMPANIES, max_concurrency=MAX_CONCURRENT_COMPANIES)
+
+    for company, insights in zip(COMPANIES, results):
+        # One write per company instead of a print per line
+        sys.stdout.write(_format_report(company, insights))
+    sys.stdout.flush()
 
     print("\n✅ Reddit API Test Complete!")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_reddit())
+    # uvloop is optional: use its faster event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    (uvloop.run if uvloop else asyncio.run)(main())